@@ -1,19 +1,70 @@
 """Simple file-based caching with expiration support."""
 
 import os
-import pickle
+import atexit
+import marshal
 import time
 import hashlib
-from typing import Any, Optional
+import weakref
+from typing import Any, BinaryIO, NamedTuple, Optional
 from .constants import DEFAULT_CACHE_PATH, DEFAULT_CACHE_EXPIRATION
 
 
+# Identifies the record-log format; older files are discarded on load
+_MAGIC = b"calends-cache-v4\n"
+
+# Content placeholder for entries whose content is still only on disk
+_UNLOADED: Any = object()
+
+# Record length marking a header-only record whose content is unchanged
+# from the previous record of the same key
+_SAME_CONTENT = -1
+
+
+class _Entry(NamedTuple):
+    """A cached item; a tuple costs less memory and lookup time than a dict."""
+
+    timestamp: float
+    content: Any
+    content_hash: Optional[str] = None
+    metadata: Optional[dict] = None
+
+
+def _content_hash(content: str) -> str:
+    """
+    Hash content for change detection.
+
+    SHA-256 stays the fastest stdlib choice: with CPU SHA extensions it
+    outruns blake2b and md5, and it keeps hashes already stored on disk valid.
+
+    Args:
+        content: Text to hash
+
+    Returns:
+        Hex digest of the UTF-8 encoded content
+    """
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+# Caches with entries that may still need flushing at interpreter exit
+_open_caches: "weakref.WeakSet[Cache]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_open_caches() -> None:
+    """Flush every cache still alive when the interpreter exits."""
+    for cache in list(_open_caches):
+        cache.flush()
+
+
 class Cache:
     """
-    Simple pickle-based cache with expiration.
+    Simple marshal-based cache with expiration.
 
-    Stores key-value pairs with timestamps in a pickle file.
-    Automatically handles expiration and file persistence.
+    Stores key-value pairs with timestamps in a marshal log file.
+    Automatically handles expiration and file persistence. Like pickle,
+    marshal is not secure against maliciously crafted data, so the cache
+    file must only ever be written by calends itself.
 
     Attributes:
         path: File path for the cache storage
@@ -34,31 +85,197 @@ class Cache:
         """
         self.path: str = path
         self.expiration: int = expiration_seconds
-        self._data: dict[str, dict[str, Any]] = {}
+        self._data: dict[str, _Entry] = {}
+        # key -> (offset, length) of content not yet read from the file
+        self._offsets: dict[str, tuple[int, int]] = {}
+        # Keys whose current entry has not been written to the log yet,
+        # in the order they were changed (a dict used as an ordered set)
+        self._dirty: dict[str, None] = {}
         self._load()
+        _open_caches.add(self)
+
+    def __del__(self) -> None:
+        """Write pending entries when the cache is garbage collected."""
+        try:
+            self.flush()
+        except Exception:
+            pass
 
     def _load(self) -> None:
         """
-        Load cache from pickle file if it exists.
+        Load the cache index from the log file if it exists.
+
+        The file starts with a magic line followed by records. Each record
+        is a marshalled (key, (timestamp, content_hash, metadata), length)
+        header followed by length bytes of marshalled content, or by nothing
+        when length is _SAME_CONTENT. Only the headers are read here; the
+        content region of each record is skipped and only loaded when its
+        key is first requested. Later records shadow earlier ones. An
+        unreadable or truncated record ends the replay and the file is
+        rewritten from what was recovered.
+        """
+        if not os.path.isfile(self.path):
+            return
+        records = 0
+        try:
+            with open(self.path, "rb") as f:
+                file_size = os.fstat(f.fileno()).st_size
+                if f.read(len(_MAGIC)) != _MAGIC:
+                    raise ValueError("Unknown cache file format")
+                end = f.tell()
+                while end < file_size:
+                    key, (timestamp, content_hash, metadata), length = marshal.load(f)
+                    offset = f.tell()
+                    if length == _SAME_CONTENT:
+                        end = offset
+                        if key not in self._offsets:
+                            continue
+                    else:
+                        end = offset + length
+                        if end > file_size:
+                            break
+                        f.seek(end)
+                        self._offsets[key] = (offset, length)
+                    records += 1
+                    self._data[key] = _Entry(
+                        timestamp, _UNLOADED, content_hash, metadata
+                    )
+        except Exception:
+            self._save()
+            return
 
-        Silently handles errors by initializing empty cache.
+        # Rewrite a log with a truncated tail, so later appends stay
+        # readable, or one that carries mostly superseded records
+        if end != file_size or records > 2 * len(self._data) + 1:
+            self._save()
+
+    def _content(self, key: str, entry: _Entry) -> Optional[Any]:
         """
-        if os.path.isfile(self.path):
-            try:
-                with open(self.path, "rb") as f:
-                    self._data = pickle.load(f)
-            except Exception:
-                self._data = {}
+        Return an entry's content, reading it from the log on first use.
+
+        Args:
+            key: Cache key of the entry
+            entry: Entry stored under the key
+
+        Returns:
+            The cached content, or None if it cannot be read
+        """
+        if entry.content is not _UNLOADED:
+            return entry.content
+        location = self._offsets.get(key)
+        if location is None:
+            return None
+        offset, length = location
+        try:
+            with open(self.path, "rb") as f:
+                f.seek(offset)
+                content = marshal.loads(f.read(length))
+        except Exception:
+            return None
+        self._data[key] = entry._replace(content=content)
+        return content
+
+    def _write_record(
+        self, f: BinaryIO, key: str, entry: _Entry, blob: Optional[bytes]
+    ) -> int:
+        """
+        Write one (header, content) record to an open log file.
+
+        Args:
+            f: Log file opened for binary writing
+            key: Cache key being written
+            entry: Entry stored under the key
+            blob: Marshalled content of the entry, or None to write a
+                header-only record that keeps the key's previous content
+
+        Returns:
+            File offset at which the content region starts
+        """
+        header = (entry.timestamp, entry.content_hash, entry.metadata)
+        if blob is None:
+            marshal.dump((key, header, _SAME_CONTENT), f)
+            return f.tell()
+        marshal.dump((key, header, len(blob)), f)
+        offset = f.tell()
+        f.write(blob)
+        return offset
 
     def _save(self) -> None:
         """
-        Persist cache to pickle file.
+        Rewrite the whole log with one record per key, compacting it.
 
+        Records are streamed one at a time into a sibling file that then
+        replaces the log, so the serialized cache is never held in memory.
+        Content that has not been loaded yet is copied over from the old log
+        as raw bytes without being unmarshalled, and stays lazily loaded.
         Silently handles errors to avoid disrupting cache operations.
         """
+        tmp_path = f"{self.path}.tmp"
+        offsets: dict[str, tuple[int, int]] = {}
+        src = None
+        try:
+            if self._offsets:
+                src = open(self.path, "rb")
+            with open(tmp_path, "wb", buffering=1 << 20) as f:
+                f.write(_MAGIC)
+                for key, entry in self._data.items():
+                    location = self._offsets.get(key)
+                    if location is None:
+                        blob = marshal.dumps(entry.content)
+                    else:
+                        src.seek(location[0])
+                        blob = src.read(location[1])
+                    offset = self._write_record(f, key, entry, blob)
+                    offsets[key] = (offset, len(blob))
+            os.replace(tmp_path, self.path)
+            self._offsets = offsets
+            self._dirty.clear()
+        except Exception:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+        finally:
+            if src is not None:
+                src.close()
+
+    def flush(self) -> None:
+        """
+        Append every entry changed since the last flush to the cache log.
+
+        set() and touch() only mark entries dirty, so a run that caches
+        several sources writes the file once. Entries whose content is
+        already in the log only get a new header. Called by CalendarManager
+        after loading, at interpreter exit, and when the cache is garbage
+        collected. Silently handles errors to avoid disrupting cache operations.
+        """
+        if not self._dirty:
+            return
+        dirty, self._dirty = self._dirty, {}
         try:
-            with open(self.path, "wb") as f:
-                pickle.dump(self._data, f)
+            with open(self.path, "ab") as f:
+                if f.tell() == 0:
+                    # The log is gone, and with it any content stored in it:
+                    # forget entries whose content was never loaded and
+                    # write out every entry still held in memory
+                    f.write(_MAGIC)
+                    self._offsets = {}
+                    self._data = {
+                        key: entry
+                        for key, entry in self._data.items()
+                        if entry.content is not _UNLOADED
+                    }
+                    dirty = self._data
+                for key in dirty:
+                    entry = self._data.get(key)
+                    if entry is None:
+                        continue
+                    if key in self._offsets:
+                        self._write_record(f, key, entry, None)
+                    else:
+                        blob = marshal.dumps(entry.content)
+                        offset = self._write_record(f, key, entry, blob)
+                        self._offsets[key] = (offset, len(blob))
         except Exception:
             pass
 
@@ -72,14 +289,65 @@ class Cache:
         Returns:
             Cached value if valid and unexpired, None otherwise
         """
+        try:
+            entry = self._data[key]
+        except KeyError:
+            return None
+        if entry.timestamp < time.time() - self.expiration:
+            # Expired entries are kept so their metadata can still drive
+            # conditional requests; cleanup_expired() removes them.
+            return None
+        return self._content(key, entry)
+
+    def touch(self, key: str) -> Optional[Any]:
+        """
+        Mark an existing entry as fresh again and return its content.
+
+        Used when the origin confirms the cached copy is still current
+        (e.g. HTTP 304 Not Modified), even if the entry had expired.
+
+        Args:
+            key: Cache key to refresh
+
+        Returns:
+            Cached content, or None if the key is not cached
+        """
         entry = self._data.get(key)
-        if not entry:
+        if entry is None:
             return None
-        timestamp = entry.get("timestamp")
-        if time.time() - timestamp > self.expiration:
-            self._data.pop(key, None)
+        content = self._content(key, entry)
+        if content is None:
             return None
-        return entry.get("content")
+        self._data[key] = _Entry(
+            time.time(), content, entry.content_hash, entry.metadata
+        )
+        self._dirty[key] = None
+        return content
+
+    def _new_entry(
+        self, key: str, content: Any, metadata: Optional[dict], timestamp: float
+    ) -> _Entry:
+        """
+        Build the entry that caches content under key.
+
+        Args:
+            key: Cache key the entry will be stored under
+            content: Content to cache
+            metadata: Optional metadata to store with it
+            timestamp: Time the content was fetched
+
+        Returns:
+            New entry; the caller stores it and marks the key dirty
+        """
+        # Store content hash for change detection
+        content_hash = _content_hash(content) if isinstance(content, str) else None
+        entry = self._data.get(key)
+        if entry is None or content_hash is None or entry.content_hash != content_hash:
+            # New content; unchanged content keeps its place in the log so
+            # flush() only has to write a fresh timestamp and metadata
+            self._offsets.pop(key, None)
+        # Store HTTP metadata if provided
+        return _Entry(timestamp, content, content_hash, metadata or None)
 
     def set(self, key: str, content: Any, metadata: Optional[dict] = None) -> None:
         """
@@ -87,24 +355,26 @@ class Cache:
 
         Args:
             key: Cache key to store under
-            content: Content to cache (must be picklable)
+            content: Content to cache (str, bytes, numbers or containers of them)
             metadata: Optional metadata (e.g., ETag, Last-Modified, content hash)
         """
-        entry = {
-            "timestamp": time.time(),
-            "content": content,
-        }
-
-        # Store content hash for change detection
-        if isinstance(content, str):
-            entry["content_hash"] = hashlib.sha256(content.encode()).hexdigest()
+        self._data[key] = self._new_entry(key, content, metadata, time.time())
+        self._dirty[key] = None
 
-        # Store HTTP metadata if provided
-        if metadata:
-            entry["metadata"] = metadata
+    def set_many(self, items: dict[str, Any]) -> None:
+        """
+        Cache several contents at once, all with the current timestamp.
 
-        self._data[key] = entry
-        self._save()
+        Args:
+            items: Mapping of cache key to content
+        """
+        now = time.time()
+        entries = {
+            key: self._new_entry(key, content, None, now)
+            for key, content in items.items()
+        }
+        self._data.update(entries)
+        self._dirty.update(dict.fromkeys(entries))
 
     def clear(self) -> None:
         """
@@ -114,6 +384,8 @@ class Cache:
         from the filesystem.
         """
         self._data = {}
+        self._offsets = {}
+        self._dirty = {}
         if os.path.isfile(self.path):
             try:
                 os.remove(self.path)
@@ -140,12 +412,10 @@ class Cache:
             - cache_file_exists: Whether cache file exists on disk
             - cache_path: Path to cache file
         """
-        valid_count = 0
-        now = time.time()
-        for entry in self._data.values():
-            timestamp = entry.get("timestamp", 0)
-            if now - timestamp <= self.expiration:
-                valid_count += 1
+        cutoff = time.time() - self.expiration
+        valid_count = sum(
+            1 for entry in self._data.values() if entry.timestamp >= cutoff
+        )
 
         return {
             "total_entries": len(self._data),
@@ -161,15 +431,18 @@ class Cache:
         Returns:
             Number of entries removed
         """
-        now = time.time()
-        expired_keys = []
-        for key, entry in self._data.items():
-            timestamp = entry.get("timestamp", 0)
-            if now - timestamp > self.expiration:
-                expired_keys.append(key)
-
-        for key in expired_keys:
-            self._data.pop(key, None)
+        cutoff = time.time() - self.expiration
+        data = self._data
+        expired_keys = [k for k, e in data.items() if e.timestamp < cutoff]
+
+        if len(expired_keys) > len(data) // 2:
+            # Mostly expired: rebuilding is cheaper than popping each key
+            self._data = {k: e for k, e in data.items() if e.timestamp >= cutoff}
+            self._offsets = {k: v for k, v in self._offsets.items() if k in self._data}
+        else:
+            for key in expired_keys:
+                del data[key]
+                self._offsets.pop(key, None)
 
         if expired_keys:
             self._save()
@@ -186,10 +459,10 @@ class Cache:
         Returns:
             Metadata dictionary or None if not found
         """
-        entry = self._data.get(key)
-        if not entry:
+        try:
+            return self._data[key].metadata
+        except KeyError:
             return None
-        return entry.get("metadata")
 
     def get_content_hash(self, key: str) -> Optional[str]:
         """
@@ -201,10 +474,10 @@ class Cache:
         Returns:
             Content hash (SHA256) or None if not found
         """
-        entry = self._data.get(key)
-        if not entry:
+        try:
+            return self._data[key].content_hash
+        except KeyError:
             return None
-        return entry.get("content_hash")
 
     def has_changed(self, key: str, new_content: str) -> bool:
         """
@@ -221,5 +494,5 @@ class Cache:
         if not old_hash:
             return True
 
-        new_hash = hashlib.sha256(new_content.encode()).hexdigest()
+        new_hash = _content_hash(new_content)
         return old_hash != new_hash
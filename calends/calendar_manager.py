@@ -6,7 +6,7 @@ from typing import Optional
 from .parser import ICalParser
 from .fetcher import ICalFetcher
 from .event_collection import EventCollection
-from .constants import DEFAULT_CACHE_EXPIRATION
+from .constants import DEFAULT_CACHE_EXPIRATION, URL_PREFIXES
 from .colors import Colors
 
 
@@ -61,25 +61,24 @@ class CalendarManager:
         # Truncate long sources
         return source if len(source) <= 60 else "..." + source[-57:]
 
-    def load_source(self, source: str) -> None:
+    def load_source(self, source: str, is_url: Optional[bool] = None) -> None:
         """
         Load events from a single calendar source.
 
         Args:
             source: URL or file path to calendar source
+            is_url: Whether source is a URL, if the caller already knows
         """
-        is_url = source.startswith("http://") or source.startswith("https://")
+        if is_url is None:
+            is_url = source.startswith(URL_PREFIXES)
         source_display = self._get_display_name(source)
 
         if self.show_progress and not is_url:
-            print(
-                f"{Colors.BLUE}Loading {source_display}...{Colors.RESET}",
-                end="",
-                file=sys.stderr,
-                flush=True,
-            )
+            sys.stderr.write(Colors.LOADING_SOURCE % source_display)
+            # Show the message before the fetch blocks
+            sys.stderr.flush()
 
-        initial_count = self.events.count()
+        initial_count = len(self.events.events)
         content = self.fetcher.fetch(source)
 
         if content:
@@ -87,21 +86,12 @@ class CalendarManager:
             # Attach calendar name to each event
             for event in parsed_events:
                 event["calendar_name"] = source_display
-            self.events.add_events(parsed_events)
-            self.events.expand_multiday_events()
-            added_count = self.events.count() - initial_count
+            self.events.add_unique_events(parsed_events)
+            self.events.expand_multiday_events(initial_count)
+            added_count = len(self.events.events) - initial_count
 
             if self.show_progress:
-                if is_url:
-                    print(
-                        f" {Colors.GREEN}✓{Colors.RESET} ({added_count} events)",
-                        file=sys.stderr,
-                    )
-                else:
-                    print(
-                        f" {Colors.GREEN}✓{Colors.RESET} ({added_count} events)",
-                        file=sys.stderr,
-                    )
+                sys.stderr.write(Colors.SOURCE_LOADED % added_count)
 
     def load_sources(self, sources: list[str]) -> None:
         """
@@ -115,15 +105,13 @@ class CalendarManager:
         self.sources = sources
 
         if self.show_progress and len(sources) > 1:
-            print(
-                f"{Colors.BOLD}Loading {len(sources)} calendar sources...{Colors.RESET}",
-                file=sys.stderr,
+            sys.stderr.write(
+                f"{Colors.BOLD}Loading {len(sources)} calendar sources...{Colors.RESET}\n"
             )
+            sys.stderr.flush()
 
         # Check if we have multiple URLs that could benefit from parallel fetching
-        url_sources = [
-            s for s in sources if s.startswith("http://") or s.startswith("https://")
-        ]
+        url_sources = {s for s in sources if s.startswith(URL_PREFIXES)}
 
         if len(url_sources) > 1:
             # Use parallel fetching for multiple URLs
@@ -131,37 +119,36 @@ class CalendarManager:
 
             for source in sources:
                 content = all_contents.get(source)
-                if content:
-                    is_url = source.startswith("http://") or source.startswith(
-                        "https://"
+                if not content:
+                    continue
+                initial_count = len(self.events.events)
+                parsed_events = self.parser.parse_ical_content(content)
+                # Attach calendar name to each event
+                source_display = self._get_display_name(source)
+                for event in parsed_events:
+                    event["calendar_name"] = source_display
+                self.events.add_unique_events(parsed_events)
+                self.events.expand_multiday_events(initial_count)
+                added_count = len(self.events.events) - initial_count
+
+                if self.show_progress:
+                    sys.stderr.write(
+                        Colors.NAMED_SOURCE_LOADED % (source_display, added_count)
                     )
-
-                    initial_count = self.events.count()
-                    parsed_events = self.parser.parse_ical_content(content)
-                    # Attach calendar name to each event
-                    source_display = self._get_display_name(source)
-                    for event in parsed_events:
-                        event["calendar_name"] = source_display
-                    self.events.add_events(parsed_events)
-                    self.events.expand_multiday_events()
-                    added_count = self.events.count() - initial_count
-
-                    if self.show_progress:
-                        source_display = self._get_display_name(source)
-                        print(
-                            f"{Colors.BLUE}{source_display}{Colors.RESET} {Colors.GREEN}✓{Colors.RESET} ({added_count} events)",
-                            file=sys.stderr,
-                        )
         else:
             # Use sequential loading for single URL or file-only sources
             for source in sources:
-                self.load_source(source)
+                self.load_source(source, source in url_sources)
 
-        if self.show_progress and len(sources) > 1:
-            print(
-                f"{Colors.BOLD}Loaded {self.count_events()} total events{Colors.RESET}\n",
-                file=sys.stderr,
-            )
+        if self.show_progress:
+            if len(sources) > 1:
+                sys.stderr.write(
+                    f"{Colors.BOLD}Loaded {self.count_events()} total events{Colors.RESET}\n\n"
+                )
+            sys.stderr.flush()
+
+        # Write everything fetched during this load to the cache in one go
+        self.fetcher.cache.flush()
 
     def reload_sources(self, force: bool = False) -> list[dict]:
         """
@@ -178,12 +165,18 @@ class CalendarManager:
             # Clear cache to force fresh fetch
             self.fetcher.cache.clear()
 
-            # Clear events
+            # Load into a fresh collection; the view keeps rendering the
+            # old list until the reload has succeeded
+            previous = self.events
             self.events = EventCollection()
 
             # Reload all sources
             if self.sources:
-                self.load_sources(self.sources)
+                try:
+                    self.load_sources(self.sources)
+                except Exception:
+                    self.events = previous
+                    raise
         else:
             # Partial refresh - only reload changed sources
             if self.sources:
@@ -193,14 +186,14 @@ class CalendarManager:
 
                 if changed_sources:
                     if self.show_progress:
-                        print(
-                            f"{Colors.CYAN}{len(changed_sources)} source(s) changed, reloading...{Colors.RESET}",
-                            file=sys.stderr,
+                        sys.stderr.write(
+                            f"{Colors.CYAN}{len(changed_sources)} source(s) changed, reloading...{Colors.RESET}\n"
                         )
+                        sys.stderr.flush()
 
-                    # Clear events and reload everything
+                    # Reload everything into a new collection
                     # (easier than tracking which events came from which source)
-                    self.events = EventCollection()
+                    events = EventCollection()
 
                     for source in self.sources:
                         content = all_contents.get(source)
@@ -210,22 +203,24 @@ class CalendarManager:
                             source_display = self._get_display_name(source)
                             for event in parsed_events:
                                 event["calendar_name"] = source_display
-                            self.events.add_events(parsed_events)
+                            events.add_unique_events(parsed_events)
 
-                    self.events.expand_multiday_events()
+                    events.expand_multiday_events()
+                    self.events = events
 
                     if self.show_progress:
-                        print(
-                            f"{Colors.GREEN}✓{Colors.RESET} Reloaded {self.count_events()} events",
-                            file=sys.stderr,
+                        sys.stderr.write(
+                            f"{Colors.GREEN}✓{Colors.RESET} Reloaded {self.count_events()} events\n"
                         )
                 else:
                     if self.show_progress:
-                        print(
-                            f"{Colors.DIM}No changes detected{Colors.RESET}",
-                            file=sys.stderr,
+                        sys.stderr.write(
+                            f"{Colors.DIM}No changes detected{Colors.RESET}\n"
                         )
 
+        if self.show_progress:
+            sys.stderr.flush()
+        self.fetcher.cache.flush()
         return self.get_all_events()
 
     def get_all_events(self) -> list[dict]:
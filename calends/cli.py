@@ -1,16 +1,36 @@
 """Command-line interface for the calends calendar viewer."""
 
+import os
 import sys
 import argparse
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timedelta, timezone
 from typing import Optional
 from .colors import Colors
-from .calendar_manager import CalendarManager
-from .view import WeeklyView
-from .config import find_default_config, load_config, parse_timezone
 from .constants import DEFAULT_AUTO_REFRESH_INTERVAL
 
 
+def _parse_date_arg(value: str) -> datetime:
+    """
+    Convert a --date argument to midnight on the Monday of its week.
+
+    Args:
+        value: Date string in YYYY-MM-DD format
+
+    Returns:
+        Naive datetime at the start of that week
+
+    Raises:
+        argparse.ArgumentTypeError: If value is not a valid date
+    """
+    try:
+        day = date.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"Invalid date format '{value}'. Use YYYY-MM-DD (e.g., 2025-01-15)"
+        )
+    return datetime(day.year, day.month, day.day) - timedelta(days=day.weekday())
+
+
 def main() -> None:
     """Main entry point for the calends CLI application."""
     parser = argparse.ArgumentParser(
@@ -54,6 +74,7 @@ For more information, visit: https://github.com/cugniere/calends
         "-d",
         "--date",
         metavar="YYYY-MM-DD",
+        type=_parse_date_arg,
         help="Start date for the week view (automatically adjusts to Monday). "
         "Default: current week.",
     )
@@ -67,7 +88,8 @@ For more information, visit: https://github.com/cugniere/calends
     parser.add_argument(
         "--no-color",
         action="store_true",
-        help="Disable colored output (useful for non-interactive terminals or piping).",
+        help="Disable colored output (useful for non-interactive terminals or piping). "
+        "Also enabled by setting the NO_COLOR environment variable.",
     )
     parser.add_argument(
         "--no-progress",
@@ -98,7 +120,8 @@ For more information, visit: https://github.com/cugniere/calends
     )
     args = parser.parse_args()
 
-    if args.no_color or not sys.stdout.isatty():
+    # Cheap checks first: NO_COLOR (https://no-color.org) avoids the isatty call
+    if args.no_color or os.environ.get("NO_COLOR") or not sys.stdout.isatty():
         Colors.disable()
 
     # Handle cache management commands
@@ -128,26 +151,21 @@ For more information, visit: https://github.com/cugniere/calends
             print(f"  Expired entries: {Colors.DIM}{expired}{Colors.RESET}")
         sys.exit(0)
 
-    start: Optional[datetime] = None
-    if args.date:
-        try:
-            start = datetime.strptime(args.date, "%Y-%m-%d")
-            start -= timedelta(days=start.weekday())
-            start = start.replace(hour=0, minute=0)
-        except ValueError as e:
-            print(
-                f"Error: Invalid date format '{args.date}'. Use YYYY-MM-DD (e.g., 2025-01-15)",
-                file=sys.stderr,
-            )
-            sys.exit(1)
-        except Exception as e:
-            print(f"Error: Failed to parse date: {e}", file=sys.stderr)
-            sys.exit(1)
+    # Imported only once the arguments are known to need them, so --help,
+    # usage errors and the cache commands skip loading the parser and view
+    from .calendar_manager import CalendarManager
+    from .view import WeeklyView
 
+    start: Optional[datetime] = args.date
     sources: list[str] = []
     tz_str: Optional[str] = None
     cache_exp: int = 60
     aliases: Optional[dict[str, str]] = None
+    if args.config or not args.sources:
+        # Config handling pulls in json and pathlib, which a run with
+        # sources on the command line never needs
+        from .config import find_default_config, load_config
+
     if args.config:
         try:
             s, tz_str, cache_exp, aliases = load_config(args.config)
@@ -191,6 +209,8 @@ For more information, visit: https://github.com/cugniere/calends
     tz_str = args.timezone or tz_str
     tz: Optional[timezone] = None
     if tz_str:
+        from .config import parse_timezone
+
         try:
             tz = parse_timezone(tz_str)
             if tz:
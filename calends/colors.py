@@ -18,9 +18,30 @@ class Colors:
 
     BG_RED = "\033[48;5;167m"
 
+    # Per-source progress templates, filled in with % by CalendarManager;
+    # built by _refresh() from the codes above
+    LOADING_SOURCE = ""
+    SOURCE_LOADED = ""
+    NAMED_SOURCE_LOADED = ""
+
     @staticmethod
     def disable():
         """Disable colors (for piping or when colors not supported)."""
-        for attr in dir(Colors):
-            if attr.isupper():
-                setattr(Colors, attr, "")
+        for attr in Colors._CODES:
+            setattr(Colors, attr, "")
+        Colors._refresh()
+
+    @staticmethod
+    def _refresh():
+        """Rebuild the progress templates from the current color codes."""
+        Colors.LOADING_SOURCE = f"{Colors.BLUE}Loading %s...{Colors.RESET}"
+        Colors.SOURCE_LOADED = f" {Colors.GREEN}✓{Colors.RESET} (%d events)\n"
+        Colors.NAMED_SOURCE_LOADED = (
+            f"{Colors.BLUE}%s{Colors.RESET} {Colors.GREEN}✓{Colors.RESET} (%d events)\n"
+        )
+
+
+# Names of the color codes, collected once instead of scanning dir() on
+# every disable()
+Colors._CODES = tuple(name for name in vars(Colors) if name.isupper())
+Colors._refresh()
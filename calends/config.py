@@ -3,9 +3,9 @@
 import os
 import sys
 import json
-import re
+from functools import lru_cache
 from datetime import timedelta, timezone
-from typing import Optional
+from typing import Any, Optional
 from pathlib import Path
 from .constants import DEFAULT_CONFIG_FILES, DEFAULT_CACHE_EXPIRATION_CONFIG
 
@@ -78,6 +78,15 @@ def _get_config_directory() -> Optional[Path]:
         return home / ".config" / "calends"
 
 
+_UTC_NAMES = frozenset({"UTC", "GMT"})
+
+# Returned by _parse_timezone for strings that are not a valid timezone
+_INVALID_TZ = object()
+
+# Invalid timezone strings already warned about, so each is reported once
+_warned_timezones: set[str] = set()
+
+
 def parse_timezone(tz_string: Optional[str]) -> Optional[timezone]:
     """
     Parse a timezone string into a timezone object.
@@ -95,17 +104,43 @@ def parse_timezone(tz_string: Optional[str]) -> Optional[timezone]:
     """
     if not tz_string:
         return None
+    tz = _parse_timezone(tz_string)
+    if tz is _INVALID_TZ:
+        if tz_string not in _warned_timezones:
+            _warned_timezones.add(tz_string)
+            print(
+                f"Warning: Invalid timezone '{tz_string}', using local.",
+                file=sys.stderr,
+            )
+        return None
+    return tz
+
+
+@lru_cache(maxsize=128)
+def _parse_timezone(tz_string: str) -> Any:
+    """
+    Memoized, side-effect free core of parse_timezone.
+
+    Args:
+        tz_string: Non-empty timezone string to parse
+
+    Returns:
+        Parsed timezone object, None for local time, or _INVALID_TZ
+    """
     s = tz_string.strip().upper()
-    if s in ("UTC", "GMT"):
+    if s in _UTC_NAMES:
         return timezone.utc
     if s == "LOCAL":
         return None
-    m = re.match(r"^([+-])(\d{2}):?(\d{2})$", s)
-    if m:
-        sign = 1 if m[1] == "+" else -1
-        return timezone(sign * timedelta(hours=int(m[2]), minutes=int(m[3])))
-    print(f"Warning: Invalid timezone '{tz_string}', using local.", file=sys.stderr)
-    return None
+    # Offsets are fixed-width "+HH:MM" or "+HHMM", so they are checked by
+    # length and position rather than with a regex
+    if len(s) in (5, 6) and s[0] in "+-" and (len(s) == 5 or s[3] == ":"):
+        digits = s[1:3] + s[-2:]
+        if digits.isdecimal():
+            hours, minutes = int(digits[:2]), int(digits[2:])
+            sign = 1 if s[0] == "+" else -1
+            return timezone(sign * timedelta(hours=hours, minutes=minutes))
+    return _INVALID_TZ
 
 
 def load_config(
@@ -144,8 +179,9 @@ def load_config(
         ValueError: If config format is invalid
     """
     try:
-        with open(path, encoding="utf-8") as f:
-            cfg = json.load(f)
+        # One bytes read; json.loads detects the encoding itself, so the file
+        # is not decoded through a text wrapper first
+        cfg = json.loads(Path(path).read_bytes())
     except FileNotFoundError:
         raise
     except PermissionError:
@@ -155,33 +191,34 @@ def load_config(
     except Exception as e:
         raise ValueError(f"Failed to read config file: {e}")
 
-    if not isinstance(cfg, dict):
+    # json only produces exact dicts and lists, so exact type checks suffice
+    if type(cfg) is not dict:
         raise ValueError("Config file must contain a JSON object")
 
-    if "calendars" not in cfg:
+    try:
+        calendars_field = cfg["calendars"]
+    except KeyError:
         raise ValueError("Config file must contain 'calendars' field")
 
-    calendars_field = cfg.get("calendars")
-    calendars: list[str] = []
     aliases: Optional[dict[str, str]] = None
 
     # Support both dict (new format with aliases) and list (old format)
-    if isinstance(calendars_field, dict):
+    field_type = type(calendars_field)
+    if field_type is dict:
         # New format: {"alias": "source", ...}
         if not calendars_field:
             raise ValueError("'calendars' dict cannot be empty")
         aliases = {}
         for alias, source in calendars_field.items():
-            if not isinstance(source, str):
+            if type(source) is not str:
                 raise ValueError(f"Calendar source for '{alias}' must be a string")
-            calendars.append(source)
             aliases[source] = alias
-    elif isinstance(calendars_field, list):
+        calendars: list[str] = list(calendars_field.values())
+    elif field_type is list:
         # Old format: ["source1", "source2", ...]
         calendars = calendars_field
         if not calendars:
             raise ValueError("'calendars' list cannot be empty")
-        aliases = None
     else:
         raise ValueError("'calendars' must be a list or dict")
 
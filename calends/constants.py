@@ -1,17 +1,23 @@
 """Configuration constants for the calends application."""
 
+from typing import Final
+
 # Cache settings
-DEFAULT_CACHE_PATH = ".calends.pkl"
-DEFAULT_CACHE_EXPIRATION = 60
+DEFAULT_CACHE_PATH: Final = ".calends.cache"
+DEFAULT_CACHE_EXPIRATION: Final = 60
 
 # Parser settings
-DEFAULT_MAX_RECURRING_INSTANCES = 100
-DEFAULT_EVENT_DURATION_HOURS = 1
-URL_FETCH_TIMEOUT = 10
+DEFAULT_MAX_RECURRING_INSTANCES: Final = 100
+DEFAULT_EVENT_DURATION_HOURS: Final = 1
+URL_FETCH_TIMEOUT: Final = 10
+# Source prefixes fetched over HTTP; anything else is a local file path
+URL_PREFIXES: Final = ("http://", "https://")
+# Upper bound on concurrent URL fetches; the threads mostly wait on the network
+MAX_FETCH_WORKERS: Final = 32
 
 # Config file settings
-DEFAULT_CONFIG_FILES = ["calendars.json", "calends.json"]
-DEFAULT_CACHE_EXPIRATION_CONFIG = 60
+DEFAULT_CONFIG_FILES: Final = ("calendars.json", "calends.json")
+DEFAULT_CACHE_EXPIRATION_CONFIG: Final = 60
 
 # Interactive mode settings
-DEFAULT_AUTO_REFRESH_INTERVAL = 60  # seconds, 0 to disable
+DEFAULT_AUTO_REFRESH_INTERVAL: Final = 60  # seconds, 0 to disable
@@ -1,10 +1,14 @@
 """Manages collections of calendar events and their expansion."""
 
-from datetime import datetime, timedelta, date
+from datetime import datetime, timedelta, date, time
+from itertools import islice
 from typing import Any
 
 EventDict = dict[str, Any]
 
+_MIDNIGHT = time()
+_ONE_DAY = timedelta(days=1)
+
 
 class EventCollection:
     """
@@ -19,6 +23,7 @@ class EventCollection:
     def __init__(self) -> None:
         """Initialize an empty event collection."""
         self.events: list[EventDict] = []
+        self._seen_keys: set[tuple[str, datetime]] = set()
 
     def add_event(self, event: EventDict) -> None:
         """
@@ -38,61 +43,93 @@ class EventCollection:
         """
         self.events.extend(events)
 
-    def expand_multiday_events(self) -> None:
+    def add_unique_events(self, events: list[EventDict]) -> int:
+        """
+        Add events, skipping ones already added by an earlier call.
+
+        Events are identified by (UID, start time), so the same occurrence
+        published by several overlapping calendars is only kept once.
+        Events without a UID are always added.
+
+        Args:
+            events: List of event dictionaries from a single source
+
+        Returns:
+            Number of events actually added
+        """
+        seen = self._seen_keys
+        unique = [
+            e for e in events if not e.get("uid") or (e["uid"], e["start"]) not in seen
+        ]
+        # Record keys only after filtering, so duplicates within one source
+        # (e.g. overridden recurrence instances) are left untouched
+        seen.update((e["uid"], e["start"]) for e in unique if e.get("uid"))
+        self.events.extend(unique)
+        return len(unique)
+
+    def expand_multiday_events(self, start_index: int = 0) -> None:
         """
         Expand multi-day events into separate daily events.
 
         Events spanning multiple days are split into one event per day,
         with appropriate start and end times for each day.
+
+        Args:
+            start_index: Position of the first event to expand; events before
+                it are assumed to have been expanded by an earlier call
         """
+        # Most calendars hold only same-day meetings; skip rebuilding the
+        # list when no event crosses a date boundary
+        if not any(
+            (start := e["start"]) and (end := e["end"]) and start.date() != end.date()
+            for e in islice(self.events, start_index, None)
+        ):
+            return
+
         expanded: list[EventDict] = []
-        for event in self.events:
-            if not event["start"] or not event["end"]:
+        for event in self.events[start_index:]:
+            event_start = event["start"]
+            event_end = event["end"]
+            if not event_start or not event_end:
                 expanded.append(event)
                 continue
 
-            start_date = event["start"].date()
-            end_date = event["end"].date()
+            start_date = event_start.date()
+            end_date = event_end.date()
 
             if start_date == end_date:
                 expanded.append(event)
                 continue
 
-            current_date = start_date
-            while current_date < end_date:
-                day_event = event.copy()
-
-                if current_date == start_date:
-                    day_event["start"] = event["start"]
-                    next_midnight = datetime.combine(
-                        current_date + timedelta(days=1), datetime.min.time()
-                    )
-                    if event["start"].tzinfo:
-                        next_midnight = next_midnight.replace(
-                            tzinfo=event["start"].tzinfo
-                        )
-                    day_event["end"] = next_midnight
-                elif current_date == end_date - timedelta(days=1):
-                    day_start = datetime.combine(current_date, datetime.min.time())
-                    if event["start"].tzinfo:
-                        day_start = day_start.replace(tzinfo=event["start"].tzinfo)
-                    day_event["start"] = day_start
-                    day_event["end"] = event["end"]
-                else:
-                    day_start = datetime.combine(current_date, datetime.min.time())
-                    day_end = datetime.combine(
-                        current_date + timedelta(days=1), datetime.min.time()
-                    )
-                    if event["start"].tzinfo:
-                        day_start = day_start.replace(tzinfo=event["start"].tzinfo)
-                        day_end = day_end.replace(tzinfo=event["start"].tzinfo)
-                    day_event["start"] = day_start
-                    day_event["end"] = day_end
-
-                expanded.append(day_event)
-                current_date += timedelta(days=1)
-
-        self.events = expanded
+            n_days = (end_date - start_date).days
+            if n_days < 0:
+                # Ends before it starts: there is no day to emit
+                continue
+
+            # Slices are copies with start/end replaced; dict.copy() plus two
+            # stores is about twice as fast as a {**event, ...} display
+            # First day: from the event start to the following midnight
+            midnight = datetime.combine(
+                start_date + _ONE_DAY, _MIDNIGHT, tzinfo=event_start.tzinfo
+            )
+            day = event.copy()
+            day["end"] = midnight
+            expanded.append(day)
+            # Whole days in between
+            for _ in range(n_days - 2):
+                next_midnight = midnight + _ONE_DAY
+                day = event.copy()
+                day["start"] = midnight
+                day["end"] = next_midnight
+                expanded.append(day)
+                midnight = next_midnight
+            # Last day: from midnight to the event end
+            if n_days > 1:
+                day = event.copy()
+                day["start"] = midnight
+                expanded.append(day)
+
+        self.events[start_index:] = expanded
 
     def filter_by_date_range(
         self, start_date: datetime, end_date: datetime
@@ -110,7 +147,7 @@ class EventCollection:
         return [
             event
             for event in self.events
-            if event["start"] and start_date <= event["start"] < end_date
+            if (start := event["start"]) and start_date <= start < end_date
         ]
 
     def count(self) -> int:
@@ -125,3 +162,4 @@ class EventCollection:
     def clear(self) -> None:
         """Clear all events from the collection."""
         self.events = []
+        self._seen_keys = set()
@@ -1,16 +1,82 @@
 """Handles fetching iCal content from URLs and files with caching."""
 
 import sys
-import asyncio
+import zlib
 from concurrent.futures import ThreadPoolExecutor
 from urllib.request import urlopen, Request
 from urllib.error import URLError, HTTPError
-from typing import Optional
+from typing import Any, Optional
 from .cache import Cache
-from .constants import DEFAULT_CACHE_EXPIRATION, URL_FETCH_TIMEOUT
+from .constants import (
+    DEFAULT_CACHE_EXPIRATION,
+    MAX_FETCH_WORKERS,
+    URL_FETCH_TIMEOUT,
+    URL_PREFIXES,
+)
 from .colors import Colors
 
 
+def _decompress(body: bytes, content_encoding: Any) -> bytes:
+    """
+    Undo the transfer compression a server applied to a response body.
+
+    Args:
+        body: Raw response body
+        content_encoding: Value of the Content-Encoding header, if any
+
+    Returns:
+        The uncompressed body; unchanged unless it is gzip or deflate encoded
+
+    Raises:
+        zlib.error: If the body is not valid compressed data
+    """
+    if not body or not isinstance(content_encoding, str):
+        return body
+    encoding = content_encoding.strip().lower()
+    if encoding not in ("gzip", "x-gzip", "deflate"):
+        return body
+    try:
+        # 32 + MAX_WBITS accepts either a gzip or a zlib header
+        return zlib.decompress(body, 32 + zlib.MAX_WBITS)
+    except zlib.error:
+        if encoding != "deflate":
+            raise
+        # Some servers send deflate data without the zlib wrapper
+        return zlib.decompress(body, -zlib.MAX_WBITS)
+
+
+def _fetch_error(url: str, error: Exception) -> Exception:
+    """
+    Translate an exception raised while fetching a URL for the caller.
+
+    Args:
+        url: URL that was being fetched
+        error: Exception raised by the request or by response validation
+
+    Returns:
+        The exception fetch_from_url should raise: a user-facing message
+        for HTTP, network and encoding errors, or error itself for the
+        timeout, connection and validation errors already worded for users
+    """
+    if isinstance(error, HTTPError):
+        if error.code == 404:
+            return Exception(f"Calendar not found (404): {url}")
+        if error.code == 403:
+            return Exception(f"Access forbidden (403): {url}")
+        if error.code == 401:
+            return Exception(f"Authentication required (401): {url}")
+        return Exception(f"HTTP Error {error.code}: {error.reason}")
+    if isinstance(error, URLError):
+        if "timed out" in str(error.reason).lower():
+            return TimeoutError(f"Request timed out after {URL_FETCH_TIMEOUT}s: {url}")
+        return ConnectionError(f"Network error: {error.reason}")
+    if isinstance(error, UnicodeDecodeError):
+        return Exception(f"Invalid text encoding in response: {error}")
+    if isinstance(error, (TimeoutError, ValueError, ConnectionError)):
+        return error
+    return Exception(f"Failed to fetch {url}: {error}")
+
+
 class ICalFetcher:
     """
     Fetches iCal content from URLs or local files with caching support.
@@ -54,7 +120,7 @@ class ICalFetcher:
             ConnectionError: If network connection fails
             Exception: For other HTTP or network errors
         """
-        if not url or not (url.startswith("http://") or url.startswith("https://")):
+        if not url or not url.startswith(URL_PREFIXES):
             raise ValueError(f"Invalid URL: {url}")
 
         cached = self.cache.get(url) if not force else None
@@ -73,43 +139,45 @@ class ICalFetcher:
             )
 
         try:
-            headers = {"User-Agent": "calends/1.0"}
+            headers = {"User-Agent": "calends/1.0", "Accept-Encoding": "gzip, deflate"}
 
             # Add conditional request headers if we have cached metadata
             metadata = self.cache.get_metadata(url)
             if metadata and not force:
                 if "etag" in metadata:
                     headers["If-None-Match"] = metadata["etag"]
-                if "last-modified" in metadata:
-                    headers["If-Modified-Since"] = metadata["last-modified"]
+                if "last_modified" in metadata:
+                    headers["If-Modified-Since"] = metadata["last_modified"]
 
             req = Request(url, headers=headers)
             with urlopen(req, timeout=URL_FETCH_TIMEOUT) as response:
                 # Handle 304 Not Modified - content hasn't changed
                 if response.status == 304:
-                    cached = self.cache.get(url)
+                    cached = self._reuse_not_modified(url)
                     if cached:
-                        if self.show_progress:
-                            print(
-                                f" {Colors.DIM}(unchanged){Colors.RESET}",
-                                file=sys.stderr,
-                            )
                         return cached
                     # Fallthrough to refetch if no cache
 
                 if response.status != 200:
                     raise Exception(f"HTTP {response.status}: Unexpected response")
 
-                content = response.read().decode("utf-8")
+                # Validate the raw body before decoding it, and without
+                # strip(), which would build another full-size copy
+                body = response.read()
+                if hasattr(response, "headers"):
+                    body = _decompress(body, response.headers.get("Content-Encoding"))
 
-                if not content.strip():
+                if not body or body.isspace():
                     raise ValueError(f"Empty response from {url}")
 
-                if "BEGIN:VCALENDAR" not in content:
+                if b"BEGIN:VCALENDAR" not in body:
                     raise ValueError(
                         f"Response does not appear to be valid iCal format"
                     )
 
+                content = body.decode("utf-8")
+                del body
+
                 # Extract and store HTTP metadata for conditional requests
                 metadata = {}
                 if hasattr(response, "headers"):
@@ -123,46 +191,31 @@ class ICalFetcher:
                 self.cache.set(url, content, metadata if metadata else None)
 
                 return content
-        except HTTPError as e:
-            if self.show_progress:
-                print(f" {Colors.RED}✗{Colors.RESET}", file=sys.stderr)
-            if e.code == 404:
-                raise Exception(f"Calendar not found (404): {url}")
-            elif e.code == 403:
-                raise Exception(f"Access forbidden (403): {url}")
-            elif e.code == 401:
-                raise Exception(f"Authentication required (401): {url}")
-            else:
-                raise Exception(f"HTTP Error {e.code}: {e.reason}")
-        except URLError as e:
-            if self.show_progress:
-                print(f" {Colors.RED}✗{Colors.RESET}", file=sys.stderr)
-            if "timed out" in str(e.reason).lower():
-                raise TimeoutError(
-                    f"Request timed out after {URL_FETCH_TIMEOUT}s: {url}"
-                )
-            else:
-                raise ConnectionError(f"Network error: {e.reason}")
-        except UnicodeDecodeError as e:
-            if self.show_progress:
-                print(f" {Colors.RED}✗{Colors.RESET}", file=sys.stderr)
-            raise Exception(f"Invalid text encoding in response: {e}")
-        except TimeoutError:
-            if self.show_progress:
-                print(f" {Colors.RED}✗{Colors.RESET}", file=sys.stderr)
-            raise
-        except ValueError:
-            if self.show_progress:
-                print(f" {Colors.RED}✗{Colors.RESET}", file=sys.stderr)
-            raise
-        except ConnectionError:
-            if self.show_progress:
-                print(f" {Colors.RED}✗{Colors.RESET}", file=sys.stderr)
-            raise
         except Exception as e:
+            # urllib reports 304 Not Modified as an HTTPError
+            if isinstance(e, HTTPError) and e.code == 304:
+                cached = self._reuse_not_modified(url)
+                if cached:
+                    return cached
             if self.show_progress:
                 print(f" {Colors.RED}✗{Colors.RESET}", file=sys.stderr)
-            raise Exception(f"Failed to fetch {url}: {str(e)}")
+            raise _fetch_error(url, e)
+
+    def _reuse_not_modified(self, url: str) -> Optional[str]:
+        """
+        Reuse cached content after the server answered 304 Not Modified.
+
+        Args:
+            url: URL whose cached copy was confirmed as current
+
+        Returns:
+            The cached content with its expiration renewed, or None if
+            nothing is cached for the URL
+        """
+        cached = self.cache.touch(url)
+        if cached and self.show_progress:
+            print(f" {Colors.DIM}(unchanged){Colors.RESET}", file=sys.stderr)
+        return cached
 
     def fetch(self, source: str) -> Optional[str]:
         """
@@ -179,25 +232,25 @@ class ICalFetcher:
             return None
 
         try:
-            if source.startswith("http://") or source.startswith("https://"):
+            if source.startswith(URL_PREFIXES):
                 return self.fetch_from_url(source)
             else:
                 try:
-                    with open(source, "r", encoding="utf-8") as f:
-                        content = f.read()
+                    with open(source, "rb") as f:
+                        body = f.read()
 
-                    if not content.strip():
+                    if not body or body.isspace():
                         print(f"Error: File is empty: {source}", file=sys.stderr)
                         return None
 
-                    if "BEGIN:VCALENDAR" not in content:
+                    if b"BEGIN:VCALENDAR" not in body:
                         print(
                             f"Error: File does not appear to be valid iCal format: {source}",
                             file=sys.stderr,
                         )
                         return None
 
-                    return content
+                    return body.decode("utf-8")
                 except FileNotFoundError:
                     print(f"Error: File not found: {source}", file=sys.stderr)
                     return None
@@ -220,27 +273,23 @@ class ICalFetcher:
             print(f"Error reading {source}: {e}", file=sys.stderr)
             return None
 
-    async def fetch_url_async(
+    def _fetch_url_or_none(
         self, url: str, display_name: Optional[str] = None
-    ) -> tuple[str, Optional[str], Optional[str]]:
+    ) -> Optional[str]:
         """
-        Async wrapper for fetch_from_url.
+        Fetch a URL for fetch_multiple, reporting failure as None.
 
         Args:
             url: URL to fetch from
             display_name: Optional friendly name to display
 
         Returns:
-            Tuple of (url, content, error_message)
+            The iCal content, or None if fetching failed
         """
-        loop = asyncio.get_event_loop()
         try:
-            content = await loop.run_in_executor(
-                None, lambda: self.fetch_from_url(url, display_name=display_name)
-            )
-            return (url, content, None)
-        except Exception as e:
-            return (url, None, str(e))
+            return self.fetch_from_url(url, display_name=display_name)
+        except Exception:
+            return None
 
     def fetch_multiple(
         self, sources: list[str], aliases: Optional[dict[str, str]] = None
@@ -248,8 +297,9 @@ class ICalFetcher:
         """
         Fetch multiple sources in parallel (URLs only).
 
-        File sources are fetched synchronously. URL sources are fetched
-        in parallel using async operations for better performance.
+        File sources are read synchronously unless there are more than a
+        few of them. URL sources are fetched in parallel on a thread pool
+        for better performance.
 
         Args:
             sources: List of URLs or file paths
@@ -259,16 +309,29 @@ class ICalFetcher:
             Dictionary mapping source to content (None if fetch failed)
         """
         aliases = aliases or {}
-        url_sources = [
-            s for s in sources if s.startswith("http://") or s.startswith("https://")
-        ]
-        file_sources = [s for s in sources if s not in url_sources]
+        url_sources: list[str] = []
+        file_sources: list[str] = []
+        for source in sources:
+            if source.startswith(URL_PREFIXES):
+                url_sources.append(source)
+            else:
+                file_sources.append(source)
 
         results = {}
 
-        # Fetch files synchronously (they're fast anyway)
-        for source in file_sources:
-            results[source] = self.fetch(source)
+        # A few local files are read faster inline than by starting threads;
+        # for more, overlap the reads (file I/O releases the GIL too)
+        if len(file_sources) <= 4:
+            for source in file_sources:
+                results[source] = self.fetch(source)
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(8, len(file_sources)),
+                thread_name_prefix="calends-read",
+            ) as executor:
+                results.update(
+                    zip(file_sources, executor.map(self.fetch, file_sources))
+                )
 
         # Fetch URLs in parallel if there are any
         if url_sources:
@@ -296,23 +359,18 @@ class ICalFetcher:
                             file=sys.stderr,
                         )
 
-                    # Run async fetches
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                    try:
-                        tasks = [
-                            self.fetch_url_async(url, aliases.get(url))
-                            for url in urls_to_fetch
-                        ]
-                        fetch_results = loop.run_until_complete(asyncio.gather(*tasks))
-
-                        for url, content, error in fetch_results:
-                            if error:
-                                results[url] = None
-                            else:
-                                results[url] = content
-                    finally:
-                        loop.close()
+                    # Network I/O releases the GIL, so threads fetch the URLs
+                    # concurrently; give every URL its own worker
+                    with ThreadPoolExecutor(
+                        max_workers=min(MAX_FETCH_WORKERS, len(urls_to_fetch)),
+                        thread_name_prefix="calends-fetch",
+                    ) as executor:
+                        contents = executor.map(
+                            self._fetch_url_or_none,
+                            urls_to_fetch,
+                            [aliases.get(url) for url in urls_to_fetch],
+                        )
+                        results.update(zip(urls_to_fetch, contents))
             except Exception as e:
                 # Fallback to sequential fetching
                 if self.show_progress:
@@ -342,9 +400,10 @@ class ICalFetcher:
         """
         results = {}
         changed = []
+        changed_files: dict[str, str] = {}
 
         for source in sources:
-            if source.startswith("http://") or source.startswith("https://"):
+            if source.startswith(URL_PREFIXES):
                 try:
                     # Get old hash before fetching
                     old_hash = self.cache.get_content_hash(source)
@@ -352,10 +411,9 @@ class ICalFetcher:
                     # Try conditional fetch (may return cached if not modified)
                     content = self.fetch_from_url(source, force=False)
 
-                    # Check if content actually changed by comparing with old hash
-                    import hashlib
-
-                    new_hash = hashlib.sha256(content.encode()).hexdigest()
+                    # A fresh download is hashed once when it is cached, so
+                    # compare the stored hashes instead of rehashing content
+                    new_hash = self.cache.get_content_hash(source)
                     if old_hash is None or old_hash != new_hash:
                         # Content changed or first fetch
                         results[source] = content
@@ -376,8 +434,7 @@ class ICalFetcher:
                         if self.cache.has_changed(source, content):
                             results[source] = content
                             changed.append(source)
-                            # Update cache for files too
-                            self.cache.set(source, content)
+                            changed_files[source] = content
                         else:
                             # Use cached content
                             cached = self.cache.get(source)
@@ -387,4 +444,8 @@ class ICalFetcher:
                 except Exception:
                     results[source] = None
 
+        # Update cache for files too
+        if changed_files:
+            self.cache.set_many(changed_files)
+
         return results, changed
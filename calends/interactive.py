@@ -1,10 +1,54 @@
 """Interactive navigation for calendar views."""
 
+import os
+import select
 import sys
 import tty
 import termios
 from typing import Optional
 
+# Seconds to wait for the rest of an escape sequence after ESC
+_ESCAPE_TIMEOUT = 0.05
+# Arrow keys in normal ("[") and application ("O") cursor mode
+_ESCAPE_SEQUENCES = {
+    b"[A": "UP",
+    b"[B": "DOWN",
+    b"[C": "RIGHT",
+    b"[D": "LEFT",
+    b"OA": "UP",
+    b"OB": "DOWN",
+    b"OC": "RIGHT",
+    b"OD": "LEFT",
+}
+
+
+def _read_escape_tail(fd: int) -> bytes:
+    """
+    Read the rest of an escape sequence after its ESC byte.
+
+    Only the bytes belonging to this sequence are consumed, so keys that
+    are already queued behind it (a held arrow key) stay unread for the
+    next call.
+
+    Args:
+        fd: File descriptor to read from
+
+    Returns:
+        The sequence without its leading ESC byte
+    """
+    tail = os.read(fd, 1)
+    if tail == b"O":
+        # SS3: exactly one final byte
+        tail += os.read(fd, 1)
+    elif tail == b"[":
+        # CSI: parameter and intermediate bytes up to a final byte
+        while True:
+            ch = os.read(fd, 1)
+            tail += ch
+            if not ch or 0x40 <= ch[0] <= 0x7E:
+                break
+    return tail
+
 
 class KeyboardInput:
     """Handle keyboard input for interactive navigation."""
@@ -23,30 +67,28 @@ class KeyboardInput:
         fd = sys.stdin.fileno()
         old_settings = termios.tcgetattr(fd)
         try:
-            tty.setraw(fd)
-            ch = sys.stdin.read(1)
-
-            if ch == "\x1b":
-                ch2 = sys.stdin.read(1)
-                if ch2 == "[":
-                    ch3 = sys.stdin.read(1)
-                    if ch3 == "A":
-                        return "UP"
-                    elif ch3 == "B":
-                        return "DOWN"
-                    elif ch3 == "C":
-                        return "RIGHT"
-                    elif ch3 == "D":
-                        return "LEFT"
-                return "ESC"
-            elif ch == "\r" or ch == "\n":
+            # TCSANOW keeps keys already queued (e.g. a held arrow key)
+            tty.setraw(fd, termios.TCSANOW)
+            # Read the descriptor directly: sys.stdin would buffer bytes
+            # that later os.read calls (and select) cannot see
+            ch = os.read(fd, 1)
+
+            if ch == b"\x1b":
+                # An arrow key arrives as one escape sequence; a lone ESC
+                # press has nothing following it
+                if not select.select([fd], [], [], _ESCAPE_TIMEOUT)[0]:
+                    return "ESC"
+                return _ESCAPE_SEQUENCES.get(_read_escape_tail(fd), "ESC")
+            elif ch == b"\r" or ch == b"\n":
                 return "ENTER"
-            elif ch == "\x03":
+            elif ch == b"\x03":
                 return "CTRL_C"
-            elif ch == "\x04":
+            elif ch == b"\x04":
                 return "CTRL_D"
-            else:
-                return ch
+            elif ch >= b"\xc0":
+                # Lead byte of a multi-byte UTF-8 character
+                ch += os.read(fd, 1 if ch < b"\xe0" else 2 if ch < b"\xf0" else 3)
+            return ch.decode(errors="replace")
         finally:
             termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
 
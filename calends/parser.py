@@ -3,7 +3,7 @@
 import re
 import sys
 from datetime import datetime, timedelta, timezone
-from typing import Optional, Any
+from typing import Optional, Any, Callable, Iterator
 from .constants import (
     DEFAULT_MAX_RECURRING_INSTANCES,
     DEFAULT_EVENT_DURATION_HOURS,
@@ -11,6 +11,78 @@ from .constants import (
 
 EventDict = dict[str, Any]
 
+_DEFAULT_DURATION = timedelta(hours=DEFAULT_EVENT_DURATION_HOURS)
+
+
+def _parse_ical_datetime_value(value: str) -> Optional[datetime]:
+    """
+    Parse a bare iCal date or datetime value by slicing its fixed-width fields.
+
+    Accepts YYYYMMDD, YYYYMMDDTHHMMSS and YYYYMMDDTHHMMSSZ. Avoids
+    datetime.strptime, which is implemented in pure Python and much slower.
+
+    Args:
+        value: Date or datetime value without property name or parameters
+
+    Returns:
+        Parsed datetime (UTC-aware for the Z form), or None if malformed
+    """
+    n = len(value)
+    try:
+        if n == 8 and value.isdigit():
+            return datetime(int(value[0:4]), int(value[4:6]), int(value[6:8]))
+        if (
+            (n == 15 or (n == 16 and value[15] == "Z"))
+            and value[8] == "T"
+            and value[:8].isdigit()
+            and value[9:15].isdigit()
+        ):
+            return datetime(
+                int(value[0:4]),
+                int(value[4:6]),
+                int(value[6:8]),
+                int(value[9:11]),
+                int(value[11:13]),
+                int(value[13:15]),
+                tzinfo=timezone.utc if n == 16 else None,
+            )
+    except ValueError:
+        pass
+    return None
+
+
+# A line break followed by one space or tab folds a long iCal line. A single
+# regex pass is used because removing folds with successive str.replace calls
+# can join text into new, spurious folds.
+_FOLD_RE = re.compile(r"\r\n[ \t]|\n[ \t]|\r[ \t]")
+
+
+def _find_line(content: str, marker: str, start: int) -> int:
+    """
+    Find a marker that occupies a whole line of iCal content.
+
+    Args:
+        content: Raw iCal content
+        marker: Exact line text to look for (e.g. "BEGIN:VEVENT")
+        start: Index to start searching from
+
+    Returns:
+        Index of the marker, or -1 if no such line exists after start
+    """
+    end_offset = len(marker)
+    pos = content.find(marker, start)
+    while pos >= 0:
+        after = pos + end_offset
+        at_line_start = pos == 0 or content[pos - 1] in "\r\n"
+        if at_line_start and content[after : after + 1] in "\r\n":
+            # A folded continuation would extend the marker into another line
+            if content[after : after + 2] == "\r\n":
+                after += 1
+            if content[after + 1 : after + 2] not in (" ", "\t"):
+                return pos
+        pos = content.find(marker, pos + 1)
+    return -1
+
 
 class ICalParser:
     """
@@ -31,6 +103,7 @@ class ICalParser:
             target_timezone: Optional timezone to convert event times to
         """
         self.target_timezone: Optional[timezone] = target_timezone
+        self._dt_cache: dict[tuple[str, Optional[timezone]], datetime] = {}
 
     def unfold_lines(self, content: str) -> list[str]:
         """
@@ -51,26 +124,43 @@ class ICalParser:
         if not isinstance(content, str):
             raise ValueError("Content must be a string")
 
-        if not content.strip():
+        if not content or content.isspace():
             return []
 
         try:
-            lines = content.replace("\r\n", "\n").replace("\r", "\n").split("\n")
-            unfolded: list[str] = []
-            current = ""
-            for line in lines:
-                if line and line[0] in (" ", "\t"):
-                    current += line[1:]
-                else:
-                    if current:
-                        unfolded.append(current)
-                    current = line
-            if current:
-                unfolded.append(current)
-            return unfolded
+            return list(self._iter_unfolded(content))
         except Exception as e:
             raise ValueError(f"Failed to unfold lines: {e}")
 
+    def _iter_unfolded(self, content: str) -> Iterator[str]:
+        """
+        Yield unfolded iCal lines.
+
+        Variant of unfold_lines used by parse_ical_content. The folds are
+        removed from the whole content in one pass and the result is split
+        into a list of lines, so the unfolded copy and its lines are both
+        built in memory before the first line is yielded.
+
+        Args:
+            content: Raw iCal content
+
+        Yields:
+            Unfolded lines
+        """
+        # Remove the folds in C instead of checking every line for a
+        # leading space or tab in Python.
+        if content[:1] in (" ", "\t"):
+            content = content[1:]
+        content = _FOLD_RE.sub("", content)
+        if content.isascii():
+            # One C-level pass; for ASCII text splitlines only differs from
+            # CR/LF splitting on control characters iCal does not allow.
+            lines = content.splitlines()
+        else:
+            # splitlines would also break on U+2028, U+0085, ... in values
+            lines = content.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+        yield from filter(None, lines)
+
     def parse_datetime(self, dt_string: str) -> Optional[datetime]:
         """
         Parse an iCal datetime string into a Python datetime object.
@@ -97,28 +187,20 @@ class ICalParser:
             if not dt_string:
                 return None
 
-            formats: list[tuple[str, bool]] = [
-                ("%Y%m%dT%H%M%SZ", True),
-                ("%Y%m%dT%H%M%S", False),
-                ("%Y%m%d", False),
-            ]
-            dt: Optional[datetime] = None
-            is_utc = False
-            for fmt, utc_flag in formats:
-                try:
-                    dt = datetime.strptime(dt_string, fmt)
-                    is_utc = utc_flag
-                    break
-                except ValueError:
-                    continue
+            # Feeds repeat the same DTSTART/DTEND values heavily, and
+            # datetimes are immutable, so parsed results can be shared.
+            cache_key = (dt_string, self.target_timezone)
+            cached = self._dt_cache.get(cache_key)
+            if cached is not None:
+                return cached
 
-            if not dt:
+            dt = _parse_ical_datetime_value(dt_string)
+            if dt is None:
                 return None
 
-            if is_utc:
-                dt = dt.replace(tzinfo=timezone.utc)
             if self.target_timezone and dt.tzinfo:
                 dt = dt.astimezone(self.target_timezone)
+            self._dt_cache[cache_key] = dt
             return dt
         except Exception as e:
             print(
@@ -199,34 +281,38 @@ class ICalParser:
             "description": "",
             "rrule": None,
             "attendees": [],
+            "uid": "",
         }
+        handlers = _PROPERTY_HANDLERS
         for line in lines:
-            if line.startswith("SUMMARY:"):
-                event["summary"] = line[8:]
-            elif line.startswith("DTSTART"):
-                event["start"] = self.parse_datetime(line)
-            elif line.startswith("DTEND"):
-                event["end"] = self.parse_datetime(line)
-            elif line.startswith("LOCATION:"):
-                event["location"] = line[9:]
-            elif line.startswith("DESCRIPTION:"):
-                event["description"] = line[12:]
-            elif line.startswith("RRULE:"):
-                event["rrule"] = self.parse_rrule(line)
-            elif line.startswith("ATTENDEE"):
-                attendee = self.parse_attendee(line)
-                if attendee:
-                    event["attendees"].append(attendee)
-
-        if event["start"] and not event["start"].tzinfo:
-            event["start"] = event["start"].replace(tzinfo=self.target_timezone)
-        if event["end"] and not event["end"].tzinfo:
-            event["end"] = event["end"].replace(tzinfo=self.target_timezone)
-
-        if event["start"] and not event["end"]:
-            event["end"] = event["start"] + timedelta(
-                hours=DEFAULT_EVENT_DURATION_HOURS
-            )
+            colon = line.find(":")
+            if colon < 0:
+                continue
+            semi = line.find(";", 0, colon)
+            handler = handlers.get(line[:colon] if semi < 0 else line[:semi])
+            if handler is None:
+                continue
+            if semi >= 0:
+                # Parameter values may be quoted and contain ':'
+                while colon >= 0 and line.count('"', semi, colon) % 2:
+                    colon = line.find(":", colon + 1)
+                if colon < 0:
+                    continue
+            handler(self, event, line, line[colon + 1 :])
+
+        # Floating times take the target timezone; without one there is
+        # nothing to attach, so skip the no-op replace() copies
+        tz = self.target_timezone
+        start = event["start"]
+        end = event["end"]
+        if tz is not None:
+            if start and not start.tzinfo:
+                start = event["start"] = start.replace(tzinfo=tz)
+            if end and not end.tzinfo:
+                end = event["end"] = end.replace(tzinfo=tz)
+
+        if start and not end:
+            event["end"] = start + _DEFAULT_DURATION
 
         return event
 
@@ -285,12 +371,18 @@ class ICalParser:
             if until:
                 until_dt = self.parse_datetime(until)
 
+            # DAILY and WEEKLY advance by a fixed step, so build it once
+            # instead of branching on FREQ for every instance
+            step: Optional[timedelta] = None
+            if freq == "DAILY":
+                step = timedelta(days=interval)
+            elif freq == "WEEKLY":
+                step = timedelta(weeks=interval)
+
             instances: list[EventDict] = []
             current_start: datetime = event["start"]
             duration: timedelta = (
-                event["end"] - event["start"]
-                if event["end"]
-                else timedelta(hours=DEFAULT_EVENT_DURATION_HOURS)
+                event["end"] - event["start"] if event["end"] else _DEFAULT_DURATION
             )
 
             for i in range(min(count, max_instances)):
@@ -303,10 +395,8 @@ class ICalParser:
                 instances.append(instance)
 
                 try:
-                    if freq == "DAILY":
-                        current_start += timedelta(days=interval)
-                    elif freq == "WEEKLY":
-                        current_start += timedelta(weeks=interval)
+                    if step is not None:
+                        current_start += step
                     elif freq == "MONTHLY":
                         month = current_start.month + interval
                         year = current_start.year + (month - 1) // 12
@@ -365,44 +455,109 @@ class ICalParser:
             )
 
         try:
-            lines = self.unfold_lines(content)
             events: list[EventDict] = []
-            in_event = False
             event_lines: list[str] = []
-
-            for line in lines:
-                if line == "BEGIN:VEVENT":
-                    in_event, event_lines = True, []
-                elif line == "END:VEVENT":
-                    if event_lines:
-                        try:
-                            event = self.parse_event(event_lines)
-                            if event["start"]:
-                                if event.get("rrule"):
-                                    instances = self.expand_recurring_event(
-                                        event, event["rrule"]
-                                    )
-                                    events.extend(instances)
-                                else:
-                                    events.append(event)
-                            else:
-                                print(
-                                    f"Warning: Skipping event without start time: {event.get('summary', 'Untitled')}",
-                                    file=sys.stderr,
-                                )
-                        except Exception as e:
-                            print(
-                                f"Warning: Failed to parse event: {e}", file=sys.stderr
+            # Locate VEVENT blocks with str.find so that lines outside
+            # events (VTIMEZONE, calendar properties) are never unfolded.
+            # Markers are handled as a line-by-line scan would: a nested
+            # BEGIN:VEVENT restarts the block, and an END:VEVENT outside a
+            # block parses the previous block's lines again.
+            begin = _find_line(content, "BEGIN:VEVENT", 0)
+            end = _find_line(content, "END:VEVENT", 0)
+            while end >= 0:
+                if 0 <= begin < end:
+                    body_start = begin + len("BEGIN:VEVENT")
+                    begin = _find_line(content, "BEGIN:VEVENT", body_start)
+                    if 0 <= begin < end:
+                        continue
+                    event_lines = list(self._iter_unfolded(content[body_start:end]))
+                end = _find_line(content, "END:VEVENT", end + len("END:VEVENT"))
+
+                if not event_lines:
+                    continue
+                try:
+                    event = self.parse_event(event_lines)
+                    if event["start"]:
+                        if event.get("rrule"):
+                            instances = self.expand_recurring_event(
+                                event, event["rrule"]
                             )
-                    in_event = False
-                elif in_event:
-                    event_lines.append(line)
-
-            if in_event:
-                print("Warning: Unclosed VEVENT block at end of file", file=sys.stderr)
+                            events.extend(instances)
+                        else:
+                            events.append(event)
+                    else:
+                        print(
+                            f"Warning: Skipping event without start time: {event.get('summary', 'Untitled')}",
+                            file=sys.stderr,
+                        )
+                except Exception as e:
+                    print(f"Warning: Failed to parse event: {e}", file=sys.stderr)
+
+            if begin >= 0:
+                print(
+                    "Warning: Unclosed VEVENT block at end of file",
+                    file=sys.stderr,
+                )
 
             return events
         except ValueError:
             raise
         except Exception as e:
             raise ValueError(f"Failed to parse iCal content: {e}")
+
+
+def _handle_summary(
+    parser: ICalParser, event: EventDict, line: str, value: str
+) -> None:
+    event["summary"] = value
+
+
+def _handle_location(
+    parser: ICalParser, event: EventDict, line: str, value: str
+) -> None:
+    event["location"] = value
+
+
+def _handle_description(
+    parser: ICalParser, event: EventDict, line: str, value: str
+) -> None:
+    event["description"] = value
+
+
+def _handle_uid(parser: ICalParser, event: EventDict, line: str, value: str) -> None:
+    event["uid"] = value
+
+
+def _handle_dtstart(
+    parser: ICalParser, event: EventDict, line: str, value: str
+) -> None:
+    event["start"] = parser.parse_datetime(value)
+
+
+def _handle_dtend(parser: ICalParser, event: EventDict, line: str, value: str) -> None:
+    event["end"] = parser.parse_datetime(value)
+
+
+def _handle_rrule(parser: ICalParser, event: EventDict, line: str, value: str) -> None:
+    event["rrule"] = parser.parse_rrule(line)
+
+
+def _handle_attendee(
+    parser: ICalParser, event: EventDict, line: str, value: str
+) -> None:
+    attendee = parser.parse_attendee(line)
+    if attendee:
+        event["attendees"].append(attendee)
+
+
+# VEVENT property name -> handler, so each line costs one dict lookup
+_PROPERTY_HANDLERS: dict[str, Callable[[ICalParser, EventDict, str, str], None]] = {
+    "SUMMARY": _handle_summary,
+    "LOCATION": _handle_location,
+    "DESCRIPTION": _handle_description,
+    "DTSTART": _handle_dtstart,
+    "DTEND": _handle_dtend,
+    "RRULE": _handle_rrule,
+    "ATTENDEE": _handle_attendee,
+    "UID": _handle_uid,
+}
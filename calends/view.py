@@ -1,8 +1,9 @@
+import re
 import sys
 import threading
 import time
-from datetime import datetime, timedelta, timezone, date
-from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from operator import itemgetter
 from typing import Optional, Any, Callable
 from .colors import Colors
 from .interactive import KeyboardInput
@@ -10,6 +11,9 @@ from .constants import DEFAULT_AUTO_REFRESH_INTERVAL
 
 EventDict = dict[str, Any]
 
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+_ANSI_ESCAPE_RE = re.compile(r"\x1b\[[0-9;]*m")
+
 
 class WeeklyView:
     """Display events in a weekly terminal view."""
@@ -66,27 +70,44 @@ class WeeklyView:
             return dt.replace(tzinfo=self.target_timezone)
         return dt
 
-    def filter_events_for_week(self) -> defaultdict[date, list[EventDict]]:
+    def filter_events_for_week(self) -> list[list[EventDict]]:
         """
         Filter events that fall within the current week.
 
         Returns:
-            Dictionary mapping dates to lists of events for that day
+            Seven lists of events (Monday to Sunday), each sorted by start
+            time; index i holds the events of start_date + i days
         """
-        week_events: defaultdict[date, list[EventDict]] = defaultdict(list)
+        target_timezone = self.target_timezone
+        # Days are calendar dates in the week's timezone, counted from the
+        # midnight that starts the week
+        week_start = self.start_date.replace(hour=0, minute=0, second=0, microsecond=0)
+        week_end = week_start + timedelta(days=7)
+        week_tz = week_start.tzinfo
+        start_ord = week_start.toordinal()
+        buckets: list[list[tuple[datetime, EventDict]]] = [[] for _ in range(7)]
         for e in self.events:
-            if not e["start"]:
+            event_start = e["start"]
+            if not event_start:
                 continue
 
-            # Ensure event start time has timezone info for comparison
-            event_start = self._ensure_timezone(e["start"])
+            # Ensure event start time has timezone info for comparison;
+            # the normalized value is kept and reused as the sort key.
+            if event_start.tzinfo is None:
+                event_start = event_start.replace(tzinfo=target_timezone)
 
-            if self.start_date <= event_start < self.end_date:
-                week_events[event_start.date()].append(e)
+            if week_start <= event_start < week_end:
+                # An ordinal difference needs no timedelta per event
+                if event_start.tzinfo is week_tz:
+                    day = event_start.toordinal() - start_ord
+                else:
+                    day = event_start.astimezone(week_tz).toordinal() - start_ord
+                buckets[day].append((event_start, e))
 
-        # Sort events by start time, ensuring all have timezone info
-        for day in week_events:
-            week_events[day].sort(key=lambda ev: self._ensure_timezone(ev["start"]))
+        week_events: list[list[EventDict]] = []
+        for pairs in buckets:
+            pairs.sort(key=itemgetter(0))
+            week_events.append([e for _, e in pairs])
         return week_events
 
     def format_time(self, dt: datetime) -> str:
@@ -104,11 +125,9 @@ class WeeklyView:
         """
         week = self.filter_events_for_week()
         all_events = []
-        # Get days in order from Monday to Sunday
-        for i in range(7):
-            day_date = (self.start_date + timedelta(days=i)).date()
-            if day_date in week:
-                all_events.extend(week[day_date])
+        # Days are already in order from Monday to Sunday
+        for day_events in week:
+            all_events.extend(day_events)
         return all_events
 
     def _display_event_details(self, event: EventDict) -> None:
@@ -118,7 +137,6 @@ class WeeklyView:
         Args:
             event: Event dictionary to display
         """
-        import re
         import textwrap
 
         width = 76
@@ -178,7 +196,7 @@ class WeeklyView:
         if event.get("description"):
             desc = event["description"].strip()
             if desc:
-                desc = re.sub(r"<[^>]+>", "", desc)
+                desc = _HTML_TAG_RE.sub("", desc)
                 desc = desc.strip()
                 if desc:
                     lines.extend(wrap_field("Description:", desc, max_label_width))
@@ -191,10 +209,9 @@ class WeeklyView:
         print(f"\n{Colors.BOLD}{top}{Colors.RESET}")
 
         # Content lines
-        ansi_escape = re.compile(r"\x1b\[[0-9;]*m")
         for line in lines:
             # Calculate visual length without ANSI codes
-            visual_len = len(ansi_escape.sub("", line))
+            visual_len = len(_ANSI_ESCAPE_RE.sub("", line))
             padding_needed = width - visual_len
             padded = line + (" " * padding_needed)
             print(f"{Colors.BOLD}│{Colors.RESET} {padded} {Colors.BOLD}│{Colors.RESET}")
@@ -206,12 +223,28 @@ class WeeklyView:
     def display(self, selected_event_index: Optional[int] = None) -> None:
         week = self.filter_events_for_week()
         now = datetime.now(self.target_timezone)
+        today = now.date()
         week_number = self.start_date.isocalendar().week
         week_title = f"Week {week_number}, {self.start_date.strftime('%B %Y')}"
         centered_title = week_title.center(80)
-        print(f"\n{Colors.BOLD}{'═'*80}{Colors.RESET}")
-        print(f"{Colors.BOLD}{Colors.CYAN}{centered_title}{Colors.RESET}")
-        print(f"{Colors.BOLD}{'═'*80}{Colors.RESET}\n")
+
+        # Bind the ANSI codes once; Colors.disable() may have blanked them,
+        # so they are read per call rather than at import time.
+        reset, bold, dim = Colors.RESET, Colors.BOLD, Colors.DIM
+        cyan, green, yellow, bg_red = (
+            Colors.CYAN,
+            Colors.GREEN,
+            Colors.YELLOW,
+            Colors.BG_RED,
+        )
+
+        # Collect the whole week and emit it with a single write instead of
+        # several print() calls (and stdout lock round-trips) per event.
+        out: list[str] = []
+        add = out.append
+        add(f"\n{bold}{'═'*80}{reset}\n")
+        add(f"{bold}{cyan}{centered_title}{reset}\n")
+        add(f"{bold}{'═'*80}{reset}\n\n")
         days = [
             "Monday",
             "Tuesday",
@@ -222,72 +255,75 @@ class WeeklyView:
             "Sunday",
         ]
 
+        # Build the line templates once per call rather than rebuilding
+        # them with f-strings for every event line.
+        ongoing_line = f"{bg_red}{bold}{{}}{reset}\n".format
+        ongoing_location = f"{bg_red}{cyan}{{}}{reset}\n".format
+        past_line = f"{dim}{{}}{{:<15}}{reset}{{}}{reset}\n".format
+        all_day_line = f"{green}{{}}{{:<15}}{reset}{{}}{reset}\n".format
+        upcoming_line = f"{cyan}{{}}{{:<15}}{reset}{{}}{reset}\n".format
+        location_line = f"{cyan}                   ⚲ {{}}{reset}\n".format
+        day_rule = f"{dim}{'─'*80}{reset}\n"
+        no_events = f"{dim}  No events{reset}\n"
+        format_time = self.format_time
+        truncate = self.truncate
+        ensure_timezone = self._ensure_timezone
+
         # Track global event index for selection
         event_counter = 0
 
         for i, dname in enumerate(days):
             current = self.start_date + timedelta(days=i)
             key = current.date()
-            is_today = key == now.date()
-            is_past = key < now.date()
-            day_color = Colors.DIM if is_past else Colors.YELLOW
-            header = f"{Colors.YELLOW if is_today else day_color}{dname}, {current.strftime('%b %d')}{Colors.RESET}"
-            print(f"\n{header}{Colors.RESET}")
-            print(f"{Colors.DIM}{'─'*80}{Colors.RESET}")
-            if key in week:
-                for e in week[key]:
+            is_today = key == today
+            is_past = key < today
+            day_color = dim if is_past else yellow
+            header = f"{yellow if is_today else day_color}{dname}, {current.strftime('%b %d')}{reset}"
+            add(f"\n{header}{reset}\n")
+            add(day_rule)
+            if week[i]:
+                for e in week[i]:
                     is_selected = (
                         selected_event_index is not None
                         and event_counter == selected_event_index
                     )
                     selection_marker = "▶ " if is_selected else "  "
-                    start, end = self.format_time(e["start"]), self.format_time(
-                        e["end"]
-                    )
+                    start, end = format_time(e["start"]), format_time(e["end"])
                     time_range = f"{start} - {end}" if start != end else "All day"
 
                     # Check if event is currently ongoing (ensure timezone-aware comparison)
-                    event_start = self._ensure_timezone(e["start"])
-                    event_end = self._ensure_timezone(e["end"])
+                    event_start = ensure_timezone(e["start"])
+                    event_end = ensure_timezone(e["end"])
                     is_ongoing = event_start <= now < event_end
 
                     # Set background and text color
                     if is_ongoing:
-                        bg_color = Colors.BG_RED
-                        text_color = Colors.BOLD
                         # Build the line and pad to 80 chars
                         line = f"{selection_marker}{time_range:<15}{e['summary']}"
-                        line = line.ljust(80)
-                        print(f"{bg_color}{text_color}{line}{Colors.RESET}")
+                        add(ongoing_line(line.ljust(80)))
                         if e["location"]:
-                            loc_line = f"                   ⚲ {self.truncate(e['location'],60)}"
-                            loc_line = loc_line.ljust(80)
-                            print(f"{bg_color}{Colors.CYAN}{loc_line}{Colors.RESET}")
+                            loc_line = (
+                                f"                   ⚲ {truncate(e['location'],60)}"
+                            )
+                            add(ongoing_location(loc_line.ljust(80)))
                     elif event_end < now:
-                        print(
-                            f"{Colors.DIM}{selection_marker}{time_range:<15}{Colors.RESET}{e['summary']}{Colors.RESET}"
-                        )
+                        add(past_line(selection_marker, time_range, e["summary"]))
                     elif time_range == "All day":
-                        print(
-                            f"{Colors.GREEN}{selection_marker}{time_range:<15}{Colors.RESET}{e['summary']}{Colors.RESET}"
-                        )
+                        add(all_day_line(selection_marker, time_range, e["summary"]))
                     else:
-                        print(
-                            f"{Colors.CYAN}{selection_marker}{time_range:<15}{Colors.RESET}{e['summary']}{Colors.RESET}"
-                        )
+                        add(upcoming_line(selection_marker, time_range, e["summary"]))
                     if e["location"]:
-                        print(
-                            f"{Colors.CYAN}                   ⚲ {self.truncate(e['location'],60)}{Colors.RESET}"
-                        )
+                        add(location_line(truncate(e["location"], 60)))
 
                     event_counter += 1
             else:
-                print(f"{Colors.DIM}  No events{Colors.RESET}")
-        total = sum(len(v) for v in week.values())
+                add(no_events)
+        total = sum(len(v) for v in week)
         total_text = f"Total events: {total}"
         centered_total = total_text.center(80)
-        print(f"\n{Colors.BOLD}{'═'*80}{Colors.RESET}")
-        print(f"{Colors.BOLD}{centered_total}{Colors.RESET}")
+        add(f"\n{bold}{'═'*80}{reset}\n")
+        add(f"{bold}{centered_total}{reset}\n")
+        sys.stdout.write("".join(out))
 
     def set_week(self, start_date: datetime) -> None:
         """
@@ -427,8 +463,6 @@ class WeeklyView:
                 self.display(self._selected_event_index if total_events > 0 else None)
 
                 # Build status bar based on available features
-                import re
-
                 def colorize_shortcuts(text: str) -> str:
                     """Colorize keyboard shortcuts in brackets with magenta."""
                     # Match content inside brackets and colorize it
@@ -454,8 +488,7 @@ class WeeklyView:
                 status_bar = "  ".join(colored_items)
 
                 # Calculate visual length for centering
-                ansi_escape = re.compile(r"\x1b\[[0-9;]*m")
-                visual_len = len(ansi_escape.sub("", status_bar))
+                visual_len = len(_ANSI_ESCAPE_RE.sub("", status_bar))
                 padding = (80 - visual_len) // 2
                 centered_bar = " " * padding + status_bar
 
@@ -47,22 +47,157 @@ class TestCache:
 
         assert result == "second"
 
+    def test_set_many(self, temp_cache_dir):
+        cache_path = str(temp_cache_dir / "test.cache")
+        cache = Cache(cache_path, expiration_seconds=3600)
+        cache.set("key1", "old")
+
+        cache.set_many({"key1": "first", "key2": "second"})
+        cache.flush()
+        reloaded = Cache(cache_path, expiration_seconds=3600)
+
+        assert reloaded.get("key1") == "first"
+        assert reloaded.get("key2") == "second"
+        assert cache.has_changed("key2", "second") is False
+
     def test_cache_file_created(self, temp_cache_dir):
         cache_path = temp_cache_dir / "test.cache"
         cache = Cache(str(cache_path))
 
         cache.set("test_key", "data")
+        assert not cache_path.exists()
+        cache.flush()
 
         assert cache_path.exists()
 
+    def test_persists_across_instances(self, temp_cache_dir):
+        cache_path = str(temp_cache_dir / "test.cache")
+        cache = Cache(cache_path, expiration_seconds=3600)
+        cache.set("key1", "first")
+        cache.set("key2", "other")
+        cache.set("key1", "second")
+        cache.flush()
+
+        reloaded = Cache(cache_path, expiration_seconds=3600)
+
+        assert reloaded.get("key1") == "second"
+        assert reloaded.get("key2") == "other"
+        assert reloaded.size() == 2
+
+    def test_unreadable_file_is_discarded(self, temp_cache_dir):
+        cache_path = temp_cache_dir / "legacy.cache"
+        cache_path.write_bytes(b"not a cache file")
+
+        cache = Cache(str(cache_path), expiration_seconds=3600)
+        assert cache.size() == 0
+
+        cache.set("key", "value")
+        cache.flush()
+        reloaded = Cache(str(cache_path), expiration_seconds=3600)
+        assert reloaded.get("key") == "value"
+
+    def test_old_pickle_file_is_discarded(self, temp_cache_dir):
+        import pickle
+
+        cache_path = temp_cache_dir / "legacy.cache"
+        cache_path.write_bytes(pickle.dumps({"key": {"content": "value"}}))
+
+        cache = Cache(str(cache_path), expiration_seconds=3600)
+
+        assert cache.size() == 0
+        assert cache_path.read_bytes().startswith(b"calends-cache-")
+
+    def test_content_is_read_on_first_get(self, temp_cache_dir):
+        cache_path = str(temp_cache_dir / "test.cache")
+        cache = Cache(cache_path, expiration_seconds=3600)
+        cache.set("key1", "first")
+        cache.set("key2", {"nested": [1, 2]})
+        cache.flush()
+
+        reloaded = Cache(cache_path, expiration_seconds=3600)
+
+        assert reloaded._offsets.keys() == {"key1", "key2"}
+        assert reloaded.get("key2") == {"nested": [1, 2]}
+        assert reloaded.get("key1") == "first"
+
+    def test_compaction_keeps_unloaded_content(self, temp_cache_dir):
+        cache_path = temp_cache_dir / "test.cache"
+        cache = Cache(str(cache_path), expiration_seconds=3600)
+        cache.set("other", "kept")
+        for i in range(10):
+            cache.set("key", f"value {i}")
+            cache.flush()
+        size_before = cache_path.stat().st_size
+
+        reloaded = Cache(str(cache_path), expiration_seconds=3600)
+
+        assert cache_path.stat().st_size < size_before
+        assert reloaded.get("other") == "kept"
+        assert reloaded.get("key") == "value 9"
+        assert Cache(str(cache_path)).get("key") == "value 9"
+
+    def test_unchanged_content_is_not_rewritten(self, temp_cache_dir):
+        cache_path = temp_cache_dir / "test.cache"
+        content = "BEGIN:VCALENDAR\n" * 1000
+        cache = Cache(str(cache_path), expiration_seconds=3600)
+        cache.set("key", content)
+        cache.flush()
+        size_before = cache_path.stat().st_size
+
+        cache.set("key", content, {"etag": "abc"})
+        cache.flush()
+        reloaded = Cache(str(cache_path), expiration_seconds=3600)
+
+        assert cache_path.stat().st_size - size_before < len(content)
+        assert reloaded.get("key") == content
+        assert reloaded.get_metadata("key") == {"etag": "abc"}
+
+    def test_truncated_tail_is_dropped(self, temp_cache_dir):
+        cache_path = temp_cache_dir / "test.cache"
+        cache = Cache(str(cache_path), expiration_seconds=3600)
+        cache.set("key1", "first")
+        cache.set("key2", "second")
+        cache.flush()
+        cache_path.write_bytes(cache_path.read_bytes()[:-3])
+
+        reloaded = Cache(str(cache_path), expiration_seconds=3600)
+        reloaded.set("key3", "third")
+        reloaded.flush()
+        again = Cache(str(cache_path), expiration_seconds=3600)
+
+        assert again.get("key1") == "first"
+        assert again.get("key2") is None
+        assert again.get("key3") == "third"
+
+    def test_flush_after_log_removed_drops_unloaded_entries(self, temp_cache_dir):
+        cache_path = temp_cache_dir / "test.cache"
+        cache = Cache(str(cache_path), expiration_seconds=3600)
+        cache.set("a", "first")
+        cache.set("b", "second")
+        cache.flush()
+
+        reloaded = Cache(str(cache_path), expiration_seconds=3600)
+        assert reloaded.get("b") == "second"
+        cache_path.unlink()
+        reloaded.set("c", "third")
+        reloaded.flush()
+        again = Cache(str(cache_path), expiration_seconds=3600)
+
+        assert reloaded.size() == 2
+        assert reloaded.get("a") is None
+        assert again.get("b") == "second"
+        assert again.get("c") == "third"
+        assert again.size() == 2
+
 
 class TestCacheManagement:
     def test_clear_cache(self, temp_cache_dir):
-        cache_path = temp_cache_dir / "test_clear.pkl"
+        cache_path = temp_cache_dir / "test_clear.cache"
         cache = Cache(path=str(cache_path))
 
         cache.set("key1", "value1")
         cache.set("key2", "value2")
+        cache.flush()
         assert cache.size() == 2
         assert cache_path.exists()
 
@@ -72,7 +207,7 @@ class TestCacheManagement:
         assert not cache_path.exists()
 
     def test_cache_size(self, temp_cache_dir):
-        cache_path = temp_cache_dir / "test_size.pkl"
+        cache_path = temp_cache_dir / "test_size.cache"
         cache = Cache(path=str(cache_path))
 
         assert cache.size() == 0
@@ -84,10 +219,11 @@ class TestCacheManagement:
         assert cache.size() == 2
 
     def test_get_stats(self, temp_cache_dir):
-        cache_path = temp_cache_dir / "test_stats.pkl"
+        cache_path = temp_cache_dir / "test_stats.cache"
         cache = Cache(path=str(cache_path), expiration_seconds=1)
 
         cache.set("key1", "value1")
+        cache.flush()
         stats = cache.get_stats()
 
         assert stats["total_entries"] == 1
@@ -96,7 +232,7 @@ class TestCacheManagement:
         assert stats["cache_path"] == str(cache_path)
 
     def test_get_stats_with_expired(self, temp_cache_dir):
-        cache_path = temp_cache_dir / "test_stats_expired.pkl"
+        cache_path = temp_cache_dir / "test_stats_expired.cache"
         cache = Cache(path=str(cache_path), expiration_seconds=1)
 
         cache.set("key1", "value1")
@@ -109,7 +245,7 @@ class TestCacheManagement:
         assert stats["valid_entries"] == 1
 
     def test_cleanup_expired(self, temp_cache_dir):
-        cache_path = temp_cache_dir / "test_cleanup.pkl"
+        cache_path = temp_cache_dir / "test_cleanup.cache"
         cache = Cache(path=str(cache_path), expiration_seconds=1)
 
         cache.set("key1", "value1")
@@ -125,7 +261,7 @@ class TestCacheManagement:
         assert cache.get("key1") is None
 
     def test_clear_nonexistent_cache(self, temp_cache_dir):
-        cache_path = temp_cache_dir / "nonexistent.pkl"
+        cache_path = temp_cache_dir / "nonexistent.cache"
         cache = Cache(path=str(cache_path))
 
         cache.clear()
@@ -139,7 +275,7 @@ class TestCacheMetadata:
 
     def test_set_with_metadata(self, temp_cache_dir):
         """Test storing content with metadata."""
-        cache_path = temp_cache_dir / "metadata_test.pkl"
+        cache_path = temp_cache_dir / "metadata_test.cache"
         cache = Cache(path=str(cache_path))
         content = "test content"
         metadata = {
@@ -156,7 +292,7 @@ class TestCacheMetadata:
 
     def test_get_content_hash(self, temp_cache_dir):
         """Test content hash generation and retrieval."""
-        cache_path = temp_cache_dir / "hash_test.pkl"
+        cache_path = temp_cache_dir / "hash_test.cache"
         cache = Cache(path=str(cache_path))
         content = "test content for hashing"
 
@@ -168,7 +304,7 @@ class TestCacheMetadata:
 
     def test_has_changed_same_content(self, temp_cache_dir):
         """Test has_changed returns False for identical content."""
-        cache_path = temp_cache_dir / "unchanged_test.pkl"
+        cache_path = temp_cache_dir / "unchanged_test.cache"
         cache = Cache(path=str(cache_path))
         content = "unchanged content"
 
@@ -178,7 +314,7 @@ class TestCacheMetadata:
 
     def test_has_changed_different_content(self, temp_cache_dir):
         """Test has_changed returns True for modified content."""
-        cache_path = temp_cache_dir / "changed_test.pkl"
+        cache_path = temp_cache_dir / "changed_test.cache"
         cache = Cache(path=str(cache_path))
         original = "original content"
         modified = "modified content"
@@ -189,21 +325,34 @@ class TestCacheMetadata:
 
     def test_has_changed_no_cache(self, temp_cache_dir):
         """Test has_changed returns True when no cache exists."""
-        cache_path = temp_cache_dir / "nocache_test.pkl"
+        cache_path = temp_cache_dir / "nocache_test.cache"
         cache = Cache(path=str(cache_path))
 
         assert cache.has_changed("nonexistent_key", "any content")
 
+    def test_touch_renews_expired_entry(self, temp_cache_dir):
+        """Test touch keeps metadata and makes an expired entry valid again."""
+        cache_path = temp_cache_dir / "touch_test.cache"
+        cache = Cache(path=str(cache_path), expiration_seconds=60)
+        cache.set("test_key", "content", {"etag": '"abc"'})
+        cache._data["test_key"] = cache._data["test_key"]._replace(timestamp=0)
+
+        assert cache.get("test_key") is None
+        assert cache.get_metadata("test_key") == {"etag": '"abc"'}
+        assert cache.touch("test_key") == "content"
+        assert cache.get("test_key") == "content"
+        assert cache.touch("missing") is None
+
     def test_get_metadata_nonexistent(self, temp_cache_dir):
         """Test get_metadata returns None for nonexistent key."""
-        cache_path = temp_cache_dir / "nometa_test.pkl"
+        cache_path = temp_cache_dir / "nometa_test.cache"
         cache = Cache(path=str(cache_path))
 
         assert cache.get_metadata("nonexistent_key") is None
 
     def test_get_content_hash_nonexistent(self, temp_cache_dir):
         """Test get_content_hash returns None for nonexistent key."""
-        cache_path = temp_cache_dir / "nohash_test.pkl"
+        cache_path = temp_cache_dir / "nohash_test.cache"
         cache = Cache(path=str(cache_path))
 
         assert cache.get_content_hash("nonexistent_key") is None
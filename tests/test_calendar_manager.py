@@ -1,5 +1,5 @@
 import pytest
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from calends.calendar_manager import CalendarManager
 
 
@@ -149,6 +149,24 @@ END:VCALENDAR"""
         summaries = {e["summary"] for e in events}
         assert summaries == {"Event 1", "Event 2"}
 
+    def test_load_sources_dedupes_shared_events(self, tmp_path):
+        shared = """BEGIN:VEVENT
+UID:shared@example.com
+DTSTART:20250115T100000Z
+DTEND:20250115T110000Z
+SUMMARY:Shared
+END:VEVENT"""
+        file1 = tmp_path / "calendar1.ics"
+        file2 = tmp_path / "calendar2.ics"
+        file1.write_text(f"BEGIN:VCALENDAR\n{shared}\nEND:VCALENDAR")
+        file2.write_text(f"BEGIN:VCALENDAR\n{shared}\nEND:VCALENDAR")
+
+        manager = CalendarManager(show_progress=False)
+        manager.load_sources([str(file1), str(file2)])
+
+        assert manager.count_events() == 1
+        assert manager.get_all_events()[0]["uid"] == "shared@example.com"
+
     def test_load_sources_empty_list(self):
         manager = CalendarManager(show_progress=False)
         manager.load_sources([])
@@ -281,6 +299,30 @@ END:VCALENDAR"""
         assert len(events) == 1
         assert isinstance(events[0], dict)
 
+    def test_reload_leaves_previous_event_list_intact(self, tmp_path):
+        ical_template = """BEGIN:VCALENDAR
+VERSION:2.0
+BEGIN:VEVENT
+UID:test@example.com
+DTSTART:20250115T100000Z
+DTEND:20250115T110000Z
+SUMMARY:%s
+END:VEVENT
+END:VCALENDAR"""
+
+        test_file = tmp_path / "calendar.ics"
+        test_file.write_text(ical_template % "Before")
+
+        manager = CalendarManager(show_progress=False)
+        manager.load_sources([str(test_file)])
+        previous = manager.get_all_events()
+
+        test_file.write_text(ical_template % "After")
+        events = manager.reload_sources(force=True)
+
+        assert [e["summary"] for e in previous] == ["Before"]
+        assert [e["summary"] for e in events] == ["After"]
+
 
 class TestCalendarAliases:
     """Test calendar alias functionality."""
@@ -28,6 +28,11 @@ class TestParseTimezone:
         tz = parse_timezone("+00:00")
         assert tz == timezone.utc
 
+    def test_parse_invalid_warns_once(self, capsys):
+        assert parse_timezone("bogus") is None
+        assert parse_timezone("bogus") is None
+        assert capsys.readouterr().err.count("Invalid timezone 'bogus'") == 1
+
 
 class TestLoadConfig:
     def test_load_valid_config(self, tmp_path):
@@ -114,6 +114,49 @@ class TestAddEvents:
         assert collection.count() == 2
 
 
+class TestAddUniqueEvents:
+    """Test adding events with cross-source deduplication."""
+
+    def _event(self, uid, day):
+        return {
+            "summary": f"Event {uid}",
+            "start": datetime(2025, 1, day, 10, 0, tzinfo=timezone.utc),
+            "end": datetime(2025, 1, day, 11, 0, tzinfo=timezone.utc),
+            "location": "",
+            "uid": uid,
+        }
+
+    def test_skips_events_seen_in_earlier_batch(self):
+        """Test that the same UID and start from another source is dropped."""
+        collection = EventCollection()
+        assert collection.add_unique_events([self._event("a", 15)]) == 1
+        added = collection.add_unique_events(
+            [self._event("a", 15), self._event("a", 16), self._event("b", 15)]
+        )
+        assert added == 2
+        assert collection.count() == 3
+
+    def test_keeps_duplicates_within_one_batch(self):
+        """Test that events from a single source are never deduplicated."""
+        collection = EventCollection()
+        collection.add_unique_events([self._event("a", 15), self._event("a", 15)])
+        assert collection.count() == 2
+
+    def test_events_without_uid_always_added(self):
+        """Test that events lacking a UID are not deduplicated."""
+        collection = EventCollection()
+        collection.add_unique_events([self._event("", 15)])
+        collection.add_unique_events([self._event("", 15)])
+        assert collection.count() == 2
+
+    def test_clear_forgets_seen_events(self):
+        """Test that events can be added again after clearing."""
+        collection = EventCollection()
+        collection.add_unique_events([self._event("a", 15)])
+        collection.clear()
+        assert collection.add_unique_events([self._event("a", 15)]) == 1
+
+
 class TestExpandMultidayEvents:
     """Test multi-day event expansion."""
 
@@ -141,6 +184,22 @@ class TestExpandMultidayEvents:
         )
         assert collection.events[0]["location"] == "Office"
 
+    def test_expand_from_start_index(self):
+        """Test that events before start_index are left as they are."""
+        collection = EventCollection()
+        event = {
+            "summary": "Three Day Event",
+            "start": datetime(2025, 1, 15, 14, 0, tzinfo=timezone.utc),
+            "end": datetime(2025, 1, 17, 10, 0, tzinfo=timezone.utc),
+            "location": "",
+        }
+        collection.add_events([event, event.copy()])
+        collection.expand_multiday_events(start_index=1)
+
+        assert collection.count() == 3
+        assert collection.events[0] is event
+        assert collection.events[2]["end"] == event["end"]
+
     def test_expand_three_day_event(self):
         """Test expanding an event that spans three days."""
         collection = EventCollection()
@@ -7,8 +7,8 @@ from calends.fetcher import ICalFetcher
 @pytest.fixture(autouse=True)
 def cleanup_cache():
     yield
-    if os.path.exists(".calends.pkl"):
-        os.remove(".calends.pkl")
+    if os.path.exists(".calends.cache"):
+        os.remove(".calends.cache")
 
 
 class TestICalFetcher:
@@ -153,6 +153,60 @@ END:VCALENDAR"""
         with pytest.raises(ConnectionError, match="Network error"):
             fetcher.fetch_from_url("https://example.com/connection-test.ics")
 
+    @patch("calends.fetcher.urlopen")
+    def test_fetch_from_url_gzip_response(self, mock_urlopen):
+        import gzip
+
+        ical_content = "BEGIN:VCALENDAR\nEND:VCALENDAR"
+        mock_response = Mock()
+        mock_response.status = 200
+        mock_response.read.return_value = gzip.compress(ical_content.encode())
+        mock_response.headers = {"Content-Encoding": "gzip"}
+        mock_response.__enter__ = Mock(return_value=mock_response)
+        mock_response.__exit__ = Mock(return_value=False)
+        mock_urlopen.return_value = mock_response
+
+        fetcher = ICalFetcher(show_progress=False)
+        result = fetcher.fetch_from_url("https://example.com/gzip-test.ics")
+
+        assert result == ical_content
+        request = mock_urlopen.call_args[0][0]
+        assert request.get_header("Accept-encoding") == "gzip, deflate"
+
+    @patch("calends.fetcher.urlopen")
+    def test_fetch_from_url_not_modified_reuses_expired_cache(self, mock_urlopen):
+        from urllib.error import HTTPError
+
+        ical_content = "BEGIN:VCALENDAR\nEND:VCALENDAR"
+        mock_response = Mock()
+        mock_response.status = 200
+        mock_response.read.return_value = ical_content.encode("utf-8")
+        mock_response.headers = {
+            "ETag": '"v1"',
+            "Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT",
+        }
+        mock_response.__enter__ = Mock(return_value=mock_response)
+        mock_response.__exit__ = Mock(return_value=False)
+        mock_urlopen.return_value = mock_response
+
+        fetcher = ICalFetcher(show_progress=False)
+        url = "https://example.com/not-modified.ics"
+        fetcher.fetch_from_url(url)
+
+        # Expire the entry, then have the server answer 304
+        fetcher.cache._data[url] = fetcher.cache._data[url]._replace(timestamp=0)
+        mock_urlopen.side_effect = HTTPError(url, 304, "Not Modified", {}, None)
+
+        result = fetcher.fetch_from_url(url)
+
+        assert result == ical_content
+        request = mock_urlopen.call_args[0][0]
+        assert request.get_header("If-none-match") == '"v1"'
+        assert request.get_header("If-modified-since") == (
+            "Wed, 21 Oct 2015 07:28:00 GMT"
+        )
+        assert fetcher.cache.get(url) == ical_content
+
 
 class TestFetch:
     def test_fetch_empty_source(self, capsys):
@@ -376,6 +430,22 @@ class TestFetchMultiple:
         assert "FILE1" in results[str(file1)]
         assert "FILE2" in results[str(file2)]
 
+    def test_fetch_multiple_many_files(self, tmp_path):
+        """Test fetch_multiple reads many files in parallel, keeping order."""
+        sources = []
+        for i in range(10):
+            path = tmp_path / f"test{i}.ics"
+            path.write_text(f"BEGIN:VCALENDAR\nFILE{i}\nEND:VCALENDAR")
+            sources.append(str(path))
+        sources.append(str(tmp_path / "missing.ics"))
+
+        fetcher = ICalFetcher(show_progress=False)
+        results = fetcher.fetch_multiple(sources)
+
+        assert list(results) == sources
+        assert all(f"FILE{i}" in results[sources[i]] for i in range(10))
+        assert results[sources[-1]] is None
+
     @patch("calends.fetcher.urlopen")
     def test_fetch_multiple_with_failures(self, mock_urlopen):
         """Test fetch_multiple handles partial failures."""
@@ -479,7 +549,7 @@ class TestRefreshIfChanged:
         fetcher.fetch_from_url(url)
 
         # Clear cache expiration to force refetch
-        fetcher.cache._data[url]["timestamp"] = 0
+        fetcher.cache._data[url] = fetcher.cache._data[url]._replace(timestamp=0)
 
         results, changed = fetcher.refresh_if_changed([url])
 
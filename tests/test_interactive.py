@@ -1,7 +1,11 @@
+import os
+import sys
+import tty
 import pytest
 import time
 import threading
 from datetime import datetime, timezone, timedelta
+from calends.interactive import KeyboardInput
 from calends.view import WeeklyView
 
 
@@ -600,3 +604,47 @@ class TestBackgroundRefresh:
         # After refresh, should be restored
         assert manager.show_progress is True
         assert manager.fetcher.show_progress is True
+
+
+@pytest.mark.skipif(not hasattr(os, "openpty"), reason="requires a pty")
+class TestGetKey:
+    """Tests for reading keys from a terminal."""
+
+    @pytest.fixture
+    def pty_stdin(self, monkeypatch):
+        master, slave = os.openpty()
+        # Raw before writing: canonical mode would hold bytes until newline
+        tty.setraw(slave)
+        stdin = os.fdopen(slave, "rb", buffering=0)
+        monkeypatch.setattr(sys, "stdin", stdin)
+        yield master
+        stdin.close()
+        os.close(master)
+
+    def test_single_arrow_key(self, pty_stdin):
+        os.write(pty_stdin, b"\x1b[A")
+        assert KeyboardInput.get_key() == "UP"
+
+    def test_application_mode_arrow_key(self, pty_stdin):
+        os.write(pty_stdin, b"\x1bOD")
+        assert KeyboardInput.get_key() == "LEFT"
+
+    def test_back_to_back_arrow_keys(self, pty_stdin):
+        os.write(pty_stdin, b"\x1b[A\x1b[A\x1b[B")
+        assert KeyboardInput.get_key() == "UP"
+        assert KeyboardInput.get_key() == "UP"
+        assert KeyboardInput.get_key() == "DOWN"
+
+    def test_arrow_key_followed_by_character(self, pty_stdin):
+        os.write(pty_stdin, b"\x1b[Cq")
+        assert KeyboardInput.get_key() == "RIGHT"
+        assert KeyboardInput.get_key() == "q"
+
+    def test_unknown_sequence_does_not_swallow_next_key(self, pty_stdin):
+        os.write(pty_stdin, b"\x1b[1;5A\x1b[B")
+        assert KeyboardInput.get_key() == "ESC"
+        assert KeyboardInput.get_key() == "DOWN"
+
+    def test_lone_escape(self, pty_stdin):
+        os.write(pty_stdin, b"\x1b")
+        assert KeyboardInput.get_key() == "ESC"
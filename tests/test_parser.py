@@ -27,6 +27,25 @@ class TestParseDateTime:
         result = parser.parse_datetime("DTSTART:20250115T140000")
         assert result is not None
 
+    def test_parse_floating_datetime(self):
+        parser = ICalParser()
+        result = parser.parse_datetime("20250115T140000")
+        assert result == datetime(2025, 1, 15, 14, 0, 0)
+        assert result.tzinfo is None
+
+    def test_parse_invalid_values(self):
+        parser = ICalParser()
+        assert parser.parse_datetime("20251315") is None
+        assert parser.parse_datetime("20250115T1400") is None
+        assert parser.parse_datetime("2025-01-15") is None
+        assert parser.parse_datetime("20250115X140000Z") is None
+
+    def test_parse_repeated_value_reuses_result(self):
+        parser = ICalParser()
+        first = parser.parse_datetime("DTSTART:20250115T140000Z")
+        second = parser.parse_datetime("DTEND:20250115T140000Z")
+        assert first is second
+
 
 class TestParseEvent:
     def test_parse_simple_event(self, sample_ics_simple):
@@ -68,6 +87,21 @@ class TestParseEvent:
         assert event["location"] == ""
         assert event["description"] == ""
 
+    def test_parse_event_with_property_parameters(self):
+        parser = ICalParser()
+        event_lines = [
+            "DTSTART;TZID=Europe/Paris:20250115T140000",
+            "SUMMARY;LANGUAGE=en:Planning",
+            'LOCATION;ALTREP="http://example.com/room":Room 1',
+            "DTSTAMP:20250101T000000Z",
+        ]
+
+        event = parser.parse_event(event_lines)
+
+        assert event["summary"] == "Planning"
+        assert event["location"] == "Room 1"
+        assert event["start"] == datetime(2025, 1, 15, 14, 0, 0)
+
 
 class TestParseRRule:
     def test_parse_daily_rrule(self):
@@ -245,6 +279,30 @@ class TestUnfoldLines:
         assert len(result) == 3
         assert "DESCRIPTION:Line one" in result[1]
 
+    def test_unfold_mixed_line_endings(self):
+        parser = ICalParser()
+        content = "SUMMARY:Event\r\nDESCRIPTION:one\r\n two\rLOCATION:Room A\n"
+
+        result = parser.unfold_lines(content)
+
+        assert result == ["SUMMARY:Event", "DESCRIPTION:onetwo", "LOCATION:Room A"]
+
+    def test_unfold_tab_fold_and_blank_lines(self):
+        parser = ICalParser()
+        content = "SUMMARY:Event\r\n\tname\r\n\r\n  indented\r\nLOCATION:Room A"
+
+        result = parser.unfold_lines(content)
+
+        assert result == ["SUMMARY:Eventname", " indented", "LOCATION:Room A"]
+
+    def test_unfold_keeps_unicode_line_separators(self):
+        parser = ICalParser()
+        content = "SUMMARY:Caf\u00e9\u2028Bar\r\nLOCATION:Room A"
+
+        result = parser.unfold_lines(content)
+
+        assert result == ["SUMMARY:Caf\u00e9\u2028Bar", "LOCATION:Room A"]
+
     def test_no_folding(self):
         parser = ICalParser()
         content = "SUMMARY:Simple Event\nLOCATION:Room A"
@@ -252,3 +310,83 @@ class TestUnfoldLines:
         result = parser.unfold_lines(content)
 
         assert len(result) == 2
+
+
+class TestParseIcalContent:
+    def test_parse_simple_content(self, sample_ics_simple):
+        parser = ICalParser()
+
+        events = parser.parse_ical_content(sample_ics_simple)
+
+        assert len(events) == 1
+        assert events[0]["summary"] == "Team Meeting"
+
+    def test_ignores_non_event_components(self):
+        parser = ICalParser()
+        content = (
+            "BEGIN:VCALENDAR\r\n"
+            "BEGIN:VTIMEZONE\r\nTZID:Europe/Paris\r\n"
+            "DTSTART:19700101T000000\r\nEND:VTIMEZONE\r\n"
+            "BEGIN:VEVENT\r\nDTSTART:20250115T140000Z\r\n"
+            "SUMMARY:Only event\r\nEND:VEVENT\r\n"
+            "END:VCALENDAR\r\n"
+        )
+
+        events = parser.parse_ical_content(content)
+
+        assert [e["summary"] for e in events] == ["Only event"]
+
+    def test_marker_inside_value_is_not_a_boundary(self):
+        parser = ICalParser()
+        content = (
+            "BEGIN:VCALENDAR\n"
+            "BEGIN:VEVENT\nDTSTART:20250115T140000Z\n"
+            "DESCRIPTION:text mentioning END:VEVENT inline\n"
+            "SUMMARY:Tricky\nEND:VEVENT\n"
+            "END:VCALENDAR"
+        )
+
+        events = parser.parse_ical_content(content)
+
+        assert len(events) == 1
+        assert events[0]["summary"] == "Tricky"
+
+    def test_folded_marker_is_not_a_boundary(self):
+        parser = ICalParser()
+        content = (
+            "BEGIN:VCALENDAR\r\n"
+            "BEGIN:VEVENT\r\nDTSTART:20250115T140000Z\r\nSUMMARY:Kept\r\n"
+            # Unfolds to "END:VEVENTx", an ordinary line of the event
+            "END:VEVENT\r\n x\r\nLOCATION:Room\r\nEND:VEVENT\r\n"
+            "END:VCALENDAR"
+        )
+
+        events = parser.parse_ical_content(content)
+
+        assert len(events) == 1
+        assert events[0]["location"] == "Room"
+
+    def test_nested_begin_restarts_event(self):
+        parser = ICalParser()
+        content = (
+            "BEGIN:VCALENDAR\n"
+            "BEGIN:VEVENT\nDTSTART:20250115T140000Z\nLOCATION:Lost\n"
+            "BEGIN:VEVENT\nDTSTART:20250116T140000Z\nSUMMARY:Second\n"
+            "END:VEVENT\n"
+            "END:VCALENDAR"
+        )
+
+        events = parser.parse_ical_content(content)
+
+        assert len(events) == 1
+        assert events[0]["summary"] == "Second"
+        assert events[0]["location"] == ""
+
+    def test_unclosed_event_warns(self, capsys):
+        parser = ICalParser()
+        content = "BEGIN:VCALENDAR\nBEGIN:VEVENT\nDTSTART:20250115T140000Z\n"
+
+        events = parser.parse_ical_content(content)
+
+        assert events == []
+        assert "Unclosed VEVENT" in capsys.readouterr().err
@@ -22,9 +22,9 @@ class TestFilterEventsForWeek:
 
         filtered = view.filter_events_for_week()
 
-        assert len(filtered) == 1
-        day_events = list(filtered.values())[0]
-        assert day_events[0]["summary"] == "In Range"
+        assert len(filtered) == 7
+        assert sum(len(day) for day in filtered) == 1
+        assert filtered[1][0]["summary"] == "In Range"
 
     def test_filter_boundary_events(self):
         week_start = datetime(2025, 1, 13, 0, 0, 0, tzinfo=timezone.utc)
@@ -44,7 +44,47 @@ class TestFilterEventsForWeek:
 
         filtered = view.filter_events_for_week()
 
-        assert len(filtered) == 2
+        assert filtered[0][0]["summary"] == "Start Boundary"
+        assert filtered[6][0]["summary"] == "End Boundary"
+
+    def test_filter_buckets_other_timezone_by_week_day(self):
+        paris = timezone(timedelta(hours=1))
+        week_start = datetime(2025, 1, 13, 0, 0, 0, tzinfo=paris)
+        events = [
+            {
+                # Monday 00:30 in Paris, still Sunday in UTC
+                "start": datetime(2025, 1, 12, 23, 30, 0, tzinfo=timezone.utc),
+                "end": datetime(2025, 1, 13, 0, 30, 0, tzinfo=timezone.utc),
+                "summary": "Early Monday",
+            },
+        ]
+        view = WeeklyView(events, week_start, paris)
+
+        filtered = view.filter_events_for_week()
+
+        assert filtered[0][0]["summary"] == "Early Monday"
+
+    def test_filter_buckets_by_date_when_week_starts_mid_day(self):
+        week_start = datetime(2025, 1, 13, 12, 0, 0, tzinfo=timezone.utc)
+        events = [
+            {
+                # Early Wednesday: less than two days after Monday noon
+                "start": datetime(2025, 1, 15, 8, 0, 0, tzinfo=timezone.utc),
+                "end": datetime(2025, 1, 15, 9, 0, 0, tzinfo=timezone.utc),
+                "summary": "Wednesday",
+            },
+            {
+                "start": datetime(2025, 1, 13, 9, 0, 0, tzinfo=timezone.utc),
+                "end": datetime(2025, 1, 13, 10, 0, 0, tzinfo=timezone.utc),
+                "summary": "Monday Morning",
+            },
+        ]
+        view = WeeklyView(events, week_start)
+
+        filtered = view.filter_events_for_week()
+
+        assert filtered[0][0]["summary"] == "Monday Morning"
+        assert filtered[2][0]["summary"] == "Wednesday"
 
     def test_filter_empty_events(self):
         week_start = datetime(2025, 1, 13, 0, 0, 0, tzinfo=timezone.utc)
@@ -52,7 +92,7 @@ class TestFilterEventsForWeek:
 
         filtered = view.filter_events_for_week()
 
-        assert len(filtered) == 0
+        assert filtered == [[] for _ in range(7)]
 
     def test_filter_all_outside_range(self):
         week_start = datetime(2025, 1, 13, 0, 0, 0, tzinfo=timezone.utc)
@@ -72,7 +112,7 @@ class TestFilterEventsForWeek:
 
         filtered = view.filter_events_for_week()
 
-        assert len(filtered) == 0
+        assert filtered == [[] for _ in range(7)]
 
 
 class TestWeeklyViewDisplay: